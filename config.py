@@ -2,9 +2,11 @@
 Loads environment(.env)/config.yaml config
 """
 
+import logging
 import os
 from dataclasses import dataclass
-from typing import Dict, List, Literal, Optional
+from types import MappingProxyType
+from typing import Dict, List, Literal, Mapping, Optional, Tuple
 
 from decouple import AutoConfig, Csv, RepositoryEnv
 
@@ -105,7 +107,15 @@ DB_PROTOCOL: str = "postgres"
 if DB_URL is None:
     DB_URL = f"{DB_PROTOCOL}://{DB_USER}:{DB_PASS}@{DB_HOST}/{DB_NAME}"
 
-LOG_LEVEL: str = config("LOG_LEVEL", default="INFO").upper()
+
+def cast_log_level(value: str) -> int:
+    level = logging.getLevelNamesMapping().get(value.upper())
+    if level is None:
+        raise ValueError(f"Unknown LOG_LEVEL value: {value}")
+    return level
+
+
+LOG_LEVEL: int = config("LOG_LEVEL", default="INFO", cast=cast_log_level)
 
 # Application local host, defaults to 0.0.0.0
 HOST: str = config("HOST", default="0.0.0.0")
@@ -135,8 +145,8 @@ class DirectionConfig:
         )
 
 
-# source and target chats mapping
-CHAT_MAPPING: Dict[int, Dict[int, List[DirectionConfig]]] = {}
+# source and target chats mapping, frozen to `CHAT_MAPPING` once built
+_chat_mapping: Dict[int, Dict[int, List[DirectionConfig]]] = {}
 
 YAML_CONFIG_FILE = "./.configs/mirror.config.yml"
 YAML_CONFIG_ENV: Optional[str] = config("YAML_CONFIG_ENV", default=None)
@@ -211,7 +221,7 @@ if os.path.exists(YAML_CONFIG_FILE) or YAML_CONFIG_ENV:
                     else:
                         target = int(target)
 
-                CHAT_MAPPING.setdefault(source, {}).setdefault(target, []).append(
+                _chat_mapping.setdefault(source, {}).setdefault(target, []).append(
                     DirectionConfig(
                         disable_delete=direction.get(
                             "disable_delete", yaml_config.get("disable_delete", False)
@@ -230,8 +240,13 @@ if os.path.exists(YAML_CONFIG_FILE) or YAML_CONFIG_ENV:
 
 else:
     # Mirror config thru environment vars
+    import re
     from functools import partial
 
+    CHAT_MAPPING_ENV_RE = re.compile(
+        r"\[?((?:-?\d+(?:#\d+)?,?)+):((?:-?\d+(?:#\d+)?,?)+)\]?", re.MULTILINE
+    )
+
     def build_mapping_from_env(
         disable_edit: bool, disable_delete: bool, filters: MessageFilter, env_str: str
     ) -> Dict[int, Dict[int, List[DirectionConfig]]]:
@@ -240,13 +255,7 @@ else:
         if not env_str:
             return mapping
 
-        import re
-
-        matches = re.findall(
-            r"\[?((?:-?\d+(?:#\d+)?,?)+):((?:-?\d+(?:#\d+)?,?)+)\]?",
-            env_str,
-            re.MULTILINE,
-        )
+        matches = CHAT_MAPPING_ENV_RE.findall(env_str)
 
         for sources, targets in matches:
             for source in sources.split(","):
@@ -303,10 +312,22 @@ else:
         message_filter,
     )
 
-    CHAT_MAPPING = config("CHAT_MAPPING", cast=cast_env_chat_mapping, default="")
+    _chat_mapping = config("CHAT_MAPPING", cast=cast_env_chat_mapping, default="")
 
-    if not CHAT_MAPPING:
+    if not _chat_mapping:
         raise Exception(
             "The chat mapping configuration is incorrect. "
             "Please provide valid non-empty CHAT_MAPPING environment variable."
         )
+
+# Freeze mapping: it's read-only and looked up on every incoming event
+CHAT_MAPPING: Mapping[int, Mapping[int, Tuple[DirectionConfig, ...]]] = (
+    MappingProxyType(
+        {
+            source: MappingProxyType(
+                {target: tuple(configs) for target, configs in targets.items()}
+            )
+            for source, targets in _chat_mapping.items()
+        }
+    )
+)
@@ -1,6 +1,12 @@
 """
 Prints telegram session string key
+
+Run with `--save` to keep the authorized session in a local session file,
+so subsequent runs reuse it without a new login
 """
+import os
+import sys
+
 try:
     from config import API_HASH, API_ID
 except Exception:
@@ -10,7 +16,13 @@ except Exception:
 from telethon import TelegramClient
 from telethon.sessions import StringSession
 
-with TelegramClient(
-    session=StringSession(), api_id=API_ID, api_hash=API_HASH
-) as client:
-    print("Session string: ", client.session.save())
+SESSION_FILE = "login.session"
+
+session = (
+    SESSION_FILE
+    if "--save" in sys.argv or os.path.exists(SESSION_FILE)
+    else StringSession()
+)
+
+with TelegramClient(session=session, api_id=API_ID, api_hash=API_HASH) as client:
+    print("Session string: ", StringSession.save(client.session))
@@ -1,4 +1,5 @@
 import logging
+from typing import Mapping
 
 from telemirror.mirroring import Telemirror
 from telemirror.storage import InMemoryDatabase, PostgresDatabase
@@ -19,7 +20,7 @@ async def serve_health_endpoint(host: str, port: int) -> None:
     await site.start()
 
 
-def configure_logging(logger_name: str, log_level: str) -> logging.Logger:
+def configure_logging(logger_name: str, log_level: int) -> logging.Logger:
     logger = logging.getLogger(logger_name)
     logger.setLevel(log_level)
 
@@ -45,7 +46,7 @@ async def run_telemirror(
     api_id: str,
     api_hash: str,
     session_string: str,
-    chat_mapping: dict,
+    chat_mapping: Mapping,
     logger: logging.Logger,
     host: str,
     port: int,
@@ -84,28 +85,30 @@ def main():
         USE_MEMORY_DB,
     )
 
+    loop_factory = None
     if sys.platform == "win32":
         if USE_MEMORY_DB is False:
             # required by psycopg async pool on windows platform
-            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+            loop_factory = asyncio.SelectorEventLoop
     else:
         import uvloop
 
-        uvloop.install()
-
-    asyncio.run(
-        run_telemirror(
-            use_memory_db=USE_MEMORY_DB,
-            db_uri=DB_URL,
-            api_id=API_ID,
-            api_hash=API_HASH,
-            session_string=SESSION_STRING,
-            chat_mapping=CHAT_MAPPING,
-            logger=configure_logging("telemirror", LOG_LEVEL),
-            host=HOST,
-            port=PORT,
+        loop_factory = uvloop.new_event_loop
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(
+            run_telemirror(
+                use_memory_db=USE_MEMORY_DB,
+                db_uri=DB_URL,
+                api_id=API_ID,
+                api_hash=API_HASH,
+                session_string=SESSION_STRING,
+                chat_mapping=CHAT_MAPPING,
+                logger=configure_logging("telemirror", LOG_LEVEL),
+                host=HOST,
+                port=PORT,
+            )
         )
-    )
 
 
 if __name__ == "__main__":
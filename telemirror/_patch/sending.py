@@ -2,12 +2,81 @@
 Adds repling in topics
 """
 
-import itertools
+import asyncio
+import functools
 import typing
 import warnings
+import weakref
 
 from telethon import TelegramClient, functions, hints, types, utils
 
+from ..misc.lrucache import LRUCache
+
+INPUT_ENTITY_CACHE_CAPACITY = 1000
+# `SUBCLASS_OF_ID` of :tl:`InputPeer` constructors
+INPUT_PEER_SUBCLASS_OF_ID = 0xC91C90B6
+INPUT_REPLY_TO_CACHE_CAPACITY = 128
+# Max amount of simultaneous media uploads per album
+ALBUM_UPLOAD_CONCURRENCY = 4
+# Max amount of message IDs per `ForwardMessagesRequest`
+FORWARD_MESSAGES_LIMIT = 100
+
+# client -> (chat id -> input peer), dropped together with the client
+_input_entity_caches: typing.MutableMapping[
+    "TelegramClient", LRUCache[int, types.TypeInputPeer]
+] = weakref.WeakKeyDictionary()
+
+
+async def _get_input_entity(
+    client: "TelegramClient", entity: "hints.EntityLike"
+) -> "types.TypeInputPeer":
+    """`client.get_input_entity` memoized per client for chat IDs"""
+    # Already resolved, e.g. by the caller of nested `send_file`
+    if getattr(entity, "SUBCLASS_OF_ID", None) == INPUT_PEER_SUBCLASS_OF_ID:
+        return entity
+
+    # Usernames are not cached: they can be changed or taken by another chat
+    if type(entity) is not int:
+        return await client.get_input_entity(entity)
+
+    cache = _input_entity_caches.get(client)
+    if cache is None:
+        cache = LRUCache[int, types.TypeInputPeer](
+            capacity=INPUT_ENTITY_CACHE_CAPACITY
+        )
+        _input_entity_caches[client] = cache
+
+    if entity in cache:
+        return cache[entity]
+
+    input_entity = await client.get_input_entity(entity)
+    cache[entity] = input_entity
+    return input_entity
+
+
+def _is_list_like(obj: typing.Any) -> bool:
+    """`utils.is_list_like` with exact type checks for the common cases"""
+    obj_type = type(obj)
+    if obj_type is list or obj_type is tuple:
+        return True
+    if obj_type is str or obj_type is bytes:
+        return False
+    return utils.is_list_like(obj)
+
+
+@functools.lru_cache(maxsize=INPUT_REPLY_TO_CACHE_CAPACITY)
+def _input_reply_to(
+    reply_to: typing.Optional[int], reply_to_topic_id: typing.Optional[int]
+) -> "typing.Optional[types.InputReplyToMessage]":
+    """Reply header for message sending requests.
+
+    Cached: sends to a fixed forum topic reuse the same header,
+    requests only read it while serializing
+    """
+    if reply_to is None:
+        return None
+    return types.InputReplyToMessage(reply_to, reply_to_topic_id)
+
 
 async def send_message(
     client: "TelegramClient",
@@ -238,10 +307,10 @@ async def send_message(
             nosound_video=nosound_video,
         )
 
-    entity = await client.get_input_entity(entity)
+    entity = await _get_input_entity(client, entity)
     if comment_to is not None:
         entity, reply_to = await client._get_comment_data(entity, comment_to)
-    else:
+    elif reply_to is not None:
         reply_to = utils.get_message_id(reply_to)
 
     if isinstance(message, types.Message):
@@ -253,7 +322,8 @@ async def send_message(
         if silent is None:
             silent = message.silent
 
-        if message.media and not isinstance(message.media, types.MessageMediaWebPage):
+        is_webpage = isinstance(message.media, types.MessageMediaWebPage)
+        if message.media and not is_webpage:
             return await send_file(
                 client,
                 entity,
@@ -269,23 +339,25 @@ async def send_message(
                 schedule=schedule,
             )
 
+        if not message.message and not is_webpage:
+            # Fail before the request, Telegram rejects it with `MessageEmptyError`
+            raise ValueError("The message cannot be empty unless a file is provided")
+
         request = functions.messages.SendMessageRequest(
             peer=entity,
             message=message.message or "",
             silent=silent,
             background=background,
-            reply_to=None
-            if reply_to is None
-            else types.InputReplyToMessage(reply_to, reply_to_topic_id),
+            reply_to=_input_reply_to(reply_to, reply_to_topic_id),
             reply_markup=markup,
             entities=message.entities,
             clear_draft=clear_draft,
-            no_webpage=not isinstance(message.media, types.MessageMediaWebPage),
+            no_webpage=not is_webpage,
             schedule_date=schedule,
         )
         message = message.message
     else:
-        if formatting_entities is None:
+        if formatting_entities is None and message:
             message, formatting_entities = await client._parse_message_text(
                 message, parse_mode
             )
@@ -297,13 +369,13 @@ async def send_message(
             message=message,
             entities=formatting_entities,
             no_webpage=not link_preview,
-            reply_to=None
-            if reply_to is None
-            else types.InputReplyToMessage(reply_to, reply_to_topic_id),
+            reply_to=_input_reply_to(reply_to, reply_to_topic_id),
             clear_draft=clear_draft,
             silent=silent,
             background=background,
-            reply_markup=client.build_reply_markup(buttons),
+            reply_markup=None
+            if buttons is None
+            else client.build_reply_markup(buttons),
             schedule_date=schedule,
         )
 
@@ -311,7 +383,13 @@ async def send_message(
     if isinstance(result, types.UpdateShortSentMessage):
         message = types.Message(
             id=result.id,
-            peer_id=await client._get_peer(entity),
+            # `entity` is already an input peer, no need to resolve it again,
+            # except for `InputPeerSelf` which requires the own user id
+            peer_id=(
+                await client._get_peer(entity)
+                if isinstance(entity, types.InputPeerSelf)
+                else utils.get_peer(entity)
+            ),
             message=message,
             date=result.date,
             out=result.out,
@@ -417,14 +495,14 @@ async def forward_messages(
             "the as_album argument is deprecated and no longer has any effect"
         )
 
-    single = not utils.is_list_like(messages)
+    single = not _is_list_like(messages)
     if single:
         messages = (messages,)
 
-    entity = await client.get_input_entity(entity)
+    entity = await _get_input_entity(client, entity)
 
     if from_peer:
-        from_peer = await client.get_input_entity(from_peer)
+        from_peer = await _get_input_entity(client, from_peer)
         from_peer_id = await client.get_peer_id(from_peer)
     else:
         from_peer_id = None
@@ -438,16 +516,43 @@ async def forward_messages(
         elif isinstance(m, types.Message):
             return m.chat_id
         else:
-            raise TypeError("Cannot forward messages of type {}".format(type(m)))
-
-    sent = []
-    for _chat_id, chunk in itertools.groupby(messages, key=get_key):
-        chunk = list(chunk)
-        if isinstance(chunk[0], int):
+            raise TypeError(f"Cannot forward messages of type {type(m)}")
+
+    if not isinstance(messages, (list, tuple)):
+        messages = list(messages)
+
+    def chunks():
+        """Split messages into runs of the same chat, at most
+        `FORWARD_MESSAGES_LIMIT` long, in a single pass"""
+        chunk_key = None
+        chunk_first = None
+        chunk_ids = []
+        for m in messages:
+            key = get_key(m)
+            if chunk_ids and (
+                key != chunk_key or len(chunk_ids) == FORWARD_MESSAGES_LIMIT
+            ):
+                yield chunk_first, chunk_ids
+                chunk_ids = []
+
+            if not chunk_ids:
+                chunk_key = key
+                chunk_first = m
+            chunk_ids.append(m if isinstance(m, int) else m.id)
+
+        if chunk_ids:
+            yield chunk_first, chunk_ids
+
+    sent = [None] * len(messages)
+    sent_offset = 0
+    # Sequential requests keep forwarded messages order
+    for first, chunk in chunks():
+        if isinstance(first, int):
             chat = from_peer
         else:
-            chat = from_peer or await client.get_input_entity(chunk[0].peer_id)
-            chunk = [m.id for m in chunk]
+            chat = from_peer or await _get_input_entity(
+                client, utils.get_peer_id(first.peer_id)
+            )
 
         req = functions.messages.ForwardMessagesRequest(
             from_peer=chat,
@@ -460,7 +565,11 @@ async def forward_messages(
             schedule_date=schedule,
         )
         result = await client(req)
-        sent.extend(client._get_response_message(req, result, entity))
+        # One response message (or `None` for invalid ones) per forwarded ID
+        sent[sent_offset : sent_offset + len(chunk)] = client._get_response_message(
+            req, result, entity
+        )
+        sent_offset += len(chunk)
 
     return sent[0] if single else sent
 
@@ -726,49 +835,56 @@ async def send_file(
     # TODO Properly implement allow_cache to reuse the sha256 of the file
     # i.e. `None` was used
     if not file:
-        raise TypeError("Cannot use {!r} as file".format(file))
+        raise TypeError(f"Cannot use {file!r} as file")
 
     if not caption:
         caption = ""
 
-    entity = await client.get_input_entity(entity)
+    entity = await _get_input_entity(client, entity)
     if comment_to is not None:
         entity, reply_to = await client._get_comment_data(entity, comment_to)
-    else:
+    elif reply_to is not None:
         reply_to = utils.get_message_id(reply_to)
 
     # First check if the user passed an iterable, in which case
     # we may want to send grouped.
-    if utils.is_list_like(file):
+    if _is_list_like(file):
         sent_count = 0
-        used_callback = (
-            None
-            if not progress_callback
-            else (lambda s, t: progress_callback(sent_count + s, len(file)))
-        )
+        total = len(file)
 
-        if utils.is_list_like(caption):
+        if _is_list_like(caption):
             captions = caption
         else:
             captions = [caption]
 
         result = []
         while file:
-            result += await _send_album(
-                client,
-                entity,
-                file[:10],
-                caption=captions[:10],
-                progress_callback=used_callback,
-                reply_to=reply_to,
-                reply_to_topic_id=reply_to_topic_id,
-                parse_mode=parse_mode,
-                silent=silent,
-                schedule=schedule,
-                supports_streaming=supports_streaming,
-                clear_draft=clear_draft,
-                force_document=force_document,
-                background=background,
+            # Bind the current offset so the callback doesn't read the
+            # loop counter (or the shrinking `file`) through a closure cell
+            used_callback = (
+                None
+                if not progress_callback
+                else (
+                    lambda s, t, base=sent_count: progress_callback(base + s, total)
+                )
+            )
+            result.extend(
+                await _send_album(
+                    client,
+                    entity,
+                    file[:10],
+                    caption=captions[:10],
+                    progress_callback=used_callback,
+                    reply_to=reply_to,
+                    reply_to_topic_id=reply_to_topic_id,
+                    parse_mode=parse_mode,
+                    silent=silent,
+                    schedule=schedule,
+                    supports_streaming=supports_streaming,
+                    clear_draft=clear_draft,
+                    force_document=force_document,
+                    background=background,
+                )
             )
             file = file[10:]
             captions = captions[10:]
@@ -798,14 +914,10 @@ async def send_file(
 
     # e.g. invalid cast from :tl:`MessageMediaWebPage`
     if not media:
-        raise TypeError("Cannot use {!r} as file".format(file))
+        raise TypeError(f"Cannot use {file!r} as file")
 
-    markup = client.build_reply_markup(buttons)
-    reply_to = (
-        None
-        if reply_to is None
-        else types.InputReplyToMessage(reply_to, reply_to_topic_id)
-    )
+    markup = None if buttons is None else client.build_reply_markup(buttons)
+    reply_to = _input_reply_to(reply_to, reply_to_topic_id)
     request = functions.messages.SendMediaRequest(
         entity,
         media,
@@ -848,57 +960,78 @@ async def _send_album(
     # In theory documents can be sent inside the albums but they appear
     # as different messages (not inside the album), and the logic to set
     # the attributes/avoid cache is already written in .send_file().
-    entity = await client.get_input_entity(entity)
-    if not utils.is_list_like(caption):
+    entity = await _get_input_entity(client, entity)
+    if not _is_list_like(caption):
         caption = (caption,)
 
-    captions = []
-    for c in reversed(caption):  # Pop from the end (so reverse)
-        captions.append(await client._parse_message_text(c or "", parse_mode))
+    async def parse_caption(c):
+        # Album items usually have no caption, nothing to parse
+        return await client._parse_message_text(c, parse_mode) if c else ("", None)
 
-    reply_to = utils.get_message_id(reply_to)
+    if reply_to is not None:
+        reply_to = utils.get_message_id(reply_to)
 
-    used_callback = (
-        None
-        if not progress_callback
-        # use an integer when sent matches total, to easily determine a file has been fully sent
-        else (
-            lambda s, t: progress_callback(
-                sent_count + 1 if s == t else sent_count + s / t, len(files)
+    upload_semaphore = asyncio.Semaphore(ALBUM_UPLOAD_CONCURRENCY)
+    # Files are uploaded concurrently, so the progress is reported as the sum
+    # of per-file progress and never goes back
+    files_progress = [0] * len(files)
+
+    async def upload(idx, file):
+        def used_callback(s, t):
+            # use an integer when sent matches total, to easily determine a file has been fully sent
+            files_progress[idx] = 1 if s == t else s / t
+            return progress_callback(sum(files_progress), len(files))
+
+        async with upload_semaphore:
+            # Albums want :tl:`InputMedia` which, in theory, includes
+            # :tl:`InputMediaUploadedPhoto`. However, using that will
+            # make it `raise MediaInvalidError`, so we need to upload
+            # it as media and then convert that to :tl:`InputMediaPhoto`.
+            fh, fm, _ = await client._file_to_media(
+                file,
+                supports_streaming=supports_streaming,
+                force_document=force_document,
+                ttl=ttl,
+                progress_callback=used_callback if progress_callback else None,
+                nosound_video=True,
             )
-        )
-    )
+            if isinstance(
+                fm, (types.InputMediaUploadedPhoto, types.InputMediaPhotoExternal)
+            ):
+                r = await client(
+                    functions.messages.UploadMediaRequest(entity, media=fm)
+                )
+
+                fm = utils.get_input_media(r.photo)
+            elif isinstance(fm, types.InputMediaUploadedDocument):
+                r = await client(
+                    functions.messages.UploadMediaRequest(entity, media=fm)
+                )
+
+                fm = utils.get_input_media(
+                    r.document, supports_streaming=supports_streaming
+                )
+
+        return fm
+
+    # Need to upload the media first, but only if they're not cached yet.
+    # Files and captions are independent, so process them concurrently.
+    # A failed upload or caption cancels the rest
+    try:
+        async with asyncio.TaskGroup() as tg:
+            caption_tasks = [tg.create_task(parse_caption(c)) for c in caption]
+            upload_tasks = [
+                tg.create_task(upload(idx, file)) for idx, file in enumerate(files)
+            ]
+    except ExceptionGroup as e:
+        # Raise the first error as is, like sequential uploads did
+        raise e.exceptions[0]
 
-    # Need to upload the media first, but only if they're not cached yet
     media = []
-    for sent_count, file in enumerate(files):
-        # Albums want :tl:`InputMedia` which, in theory, includes
-        # :tl:`InputMediaUploadedPhoto`. However, using that will
-        # make it `raise MediaInvalidError`, so we need to upload
-        # it as media and then convert that to :tl:`InputMediaPhoto`.
-        fh, fm, _ = await client._file_to_media(
-            file,
-            supports_streaming=supports_streaming,
-            force_document=force_document,
-            ttl=ttl,
-            progress_callback=used_callback,
-            nosound_video=True,
-        )
-        if isinstance(
-            fm, (types.InputMediaUploadedPhoto, types.InputMediaPhotoExternal)
-        ):
-            r = await client(functions.messages.UploadMediaRequest(entity, media=fm))
-
-            fm = utils.get_input_media(r.photo)
-        elif isinstance(fm, types.InputMediaUploadedDocument):
-            r = await client(functions.messages.UploadMediaRequest(entity, media=fm))
-
-            fm = utils.get_input_media(
-                r.document, supports_streaming=supports_streaming
-            )
-
-        if captions:
-            caption, msg_entities = captions.pop()
+    for idx, upload_task in enumerate(upload_tasks):
+        fm = upload_task.result()
+        if idx < len(caption_tasks):
+            caption, msg_entities = caption_tasks[idx].result()
         else:
             caption, msg_entities = "", None
         media.append(
@@ -913,9 +1046,7 @@ async def _send_album(
     # Now we can construct the multi-media request
     request = functions.messages.SendMultiMediaRequest(
         entity,
-        reply_to=None
-        if reply_to is None
-        else types.InputReplyToMessage(reply_to, reply_to_topic_id),
+        reply_to=_input_reply_to(reply_to, reply_to_topic_id),
         multi_media=media,
         silent=silent,
         schedule_date=schedule,
@@ -2,6 +2,9 @@ def patch_input_media_with_spoiler():
     """Patch `utils.get_input_media` to work with spoiler"""
     from telethon import utils
 
+    # Media types without `spoiler` field
+    missing = object()
+
     def patch_input_media_spoiler(fn):
         from functools import wraps
 
@@ -28,8 +31,10 @@ def patch_input_media_with_spoiler():
                 supports_streaming=supports_streaming,
                 ttl=ttl,
             )
-            if hasattr(media, "spoiler"):
-                input_media.spoiler = media.spoiler or spoiler
+            media_spoiler = getattr(media, "spoiler", missing)
+            # Unset spoiler flag is serialized the same as False, skip the write
+            if media_spoiler is not missing and (media_spoiler or spoiler):
+                input_media.spoiler = True
             return input_media
 
         return wrapper
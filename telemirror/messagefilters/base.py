@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Protocol, Tuple, Type
+from typing import List, Protocol, Tuple, Type
 
 from ..hints import EventEntity, EventLike, EventAlbumMessage, EventMessage
 
@@ -10,6 +10,11 @@ class MessageFilter(Protocol):
         """Indicates that restricted content is allowed or not to process"""
         return False
 
+    @property
+    def modifies_message(self) -> bool:
+        """Indicates that filter may change the processed message in-place"""
+        return True
+
     async def process(
         self, entity: EventEntity, event_type: Type[EventLike]
     ) -> Tuple[bool, EventEntity]:
@@ -87,20 +92,39 @@ class CompositeMessageFilter(MessageFilter):
     """
 
     def __init__(self, *arg: MessageFilter) -> None:
-        self._filters = list(arg)
+        from .messagefilters import EmptyMessageFilter
+
+        # Flatten nested composites into a single chain,
+        # pass-through filters are dropped as they change nothing
+        self._filters: List[MessageFilter] = []
+        for f in arg:
+            if isinstance(f, CompositeMessageFilter):
+                self._filters.extend(f._filters)
+            elif not isinstance(f, EmptyMessageFilter):
+                self._filters.append(f)
+
+        # Resolve bound `process` methods once instead of per message
+        self._processors = tuple(f.process for f in self._filters)
+
         self._is_restricted_content_allowed = any(
             f.restricted_content_allowed for f in self._filters
         )
 
+        self._modifies_message = any(f.modifies_message for f in self._filters)
+
     @property
     def restricted_content_allowed(self) -> bool:
         return self._is_restricted_content_allowed
 
+    @property
+    def modifies_message(self) -> bool:
+        return self._modifies_message
+
     async def process(
         self, message: EventEntity, event_type: Type[EventLike]
     ) -> Tuple[bool, EventEntity]:
-        for f in self._filters:
-            proceed, message = await f.process(message, event_type)
+        for process in self._processors:
+            proceed, message = await process(message, event_type)
             if proceed is False:
                 return False, message
         return True, message
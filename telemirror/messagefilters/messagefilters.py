@@ -1,9 +1,10 @@
 import re
-from typing import Optional, Set, Tuple, Type, Union
+from typing import List, Optional, Set, Tuple, Type, Union
 
 from telethon import events, types, utils
 
 from ..hints import EventAlbumMessage, EventEntity, EventLike, EventMessage
+from ..misc.surrogate import add_surrogate, del_surrogate, surrogate_len
 from ..misc.urlmatcher import UrlMatcher
 from ..mixins import (
     ChannelName,
@@ -18,6 +19,10 @@ from .base import MessageFilter
 class EmptyMessageFilter(MessageFilter):
     """Do nothing with message"""
 
+    @property
+    def modifies_message(self) -> bool:
+        return False
+
     async def process(
         self, message: EventEntity, event_type: Type[EventLike]
     ) -> Tuple[bool, EventEntity]:
@@ -32,6 +37,10 @@ class EmptyMessageFilter(MessageFilter):
 class SkipAllFilter(MessageFilter):
     """Skips all messages"""
 
+    @property
+    def modifies_message(self) -> bool:
+        return False
+
     async def process(
         self, message: EventEntity, event_type: Type[EventLike]
     ) -> Tuple[bool, EventEntity]:
@@ -51,8 +60,22 @@ class SkipUrlFilter(MessageFilter):
             Enable skipping text mentions (@channel). Defaults to True.
     """
 
+    URL_ENTITIES = frozenset((types.MessageEntityUrl, types.MessageEntityTextUrl))
+    MENTION_ENTITIES = frozenset(
+        (types.MessageEntityMention, types.MessageEntityMentionName)
+    )
+
     def __init__(self: "SkipUrlFilter", skip_mention: bool = True) -> None:
         self._skip_mention = skip_mention
+        self._skipped_entities = (
+            self.URL_ENTITIES | self.MENTION_ENTITIES
+            if skip_mention
+            else self.URL_ENTITIES
+        )
+
+    @property
+    def modifies_message(self) -> bool:
+        return False
 
     async def _process_message(
         self, message: EventMessage, event_type: Type[EventLike]
@@ -60,15 +83,10 @@ class SkipUrlFilter(MessageFilter):
         if isinstance(message.media, types.MessageMediaWebPage):
             return False, message
 
+        # Exact type checks, TL entity types are not subclassed
+        skipped_entities = self._skipped_entities
         for entity in message.entities or []:
-            if isinstance(
-                entity, (types.MessageEntityUrl, types.MessageEntityTextUrl)
-            ) or (
-                isinstance(
-                    entity, (types.MessageEntityMention, types.MessageEntityMentionName)
-                )
-                and self._skip_mention
-            ):
+            if type(entity) in skipped_entities:
                 return False, message
 
         return True, message
@@ -98,6 +116,11 @@ class UrlMessageFilter(UpdateEntitiesParams, MessageFilter):
             Defaults to False.
     """
 
+    # TextUrl anchors are deliberately checked as hidden mentions
+    MENTION_CHECKED_ENTITIES = frozenset(
+        (types.MessageEntityMention, types.MessageEntityTextUrl)
+    )
+
     def __init__(
         self: "UrlMessageFilter",
         placeholder: str = "***",
@@ -106,7 +129,7 @@ class UrlMessageFilter(UpdateEntitiesParams, MessageFilter):
         filter_mention: Union[bool, Set[str]] = False,
         filter_by_id_mention: bool = False,
     ) -> None:
-        self._placeholder = utils.add_surrogate(placeholder)
+        self._placeholder = add_surrogate(placeholder)
         self._placeholder_len = len(self._placeholder)
 
         self._url_matcher = UrlMatcher(blacklist, whitelist)
@@ -123,72 +146,100 @@ class UrlMessageFilter(UpdateEntitiesParams, MessageFilter):
     async def _process_message(
         self, message: EventMessage, event_type: Type[EventLike]
     ) -> Tuple[bool, EventMessage]:
-        filtered_text = utils.add_surrogate(message.message)
-        filtered_entities = list[types.TypeMessageEntity]()
+        if (
+            not message.entities
+            and not isinstance(message.media, types.MessageMediaWebPage)
+            and "." not in message.message
+        ):
+            # No entities, link preview or URL-like text to filter
+            return True, message
 
-        for entity in message.entities or []:
-            drop_entity = False
-            update_pos = False
+        # The splice below walks entities in text order, while other filters
+        # may append entities out of order (e.g. `ForwardFormatFilter` header)
+        entities = sorted(message.entities or [], key=lambda entity: entity.offset)
 
-            if (
-                isinstance(entity, types.MessageEntityUrl)
-                and self._url_matcher.match(
-                    filtered_text[entity.offset : entity.offset + entity.length]
-                )
-            ) or (
-                isinstance(
-                    entity, (types.MessageEntityMention, types.MessageEntityTextUrl)
+        source_text = add_surrogate(message.message)
+        filtered_parts = list[str]()
+        # Created on the first dropped entity, till then all entities are kept
+        filtered_entities: Optional[List[types.TypeMessageEntity]] = None
+
+        # Source text position up to which text is copied to `filtered_parts`
+        source_pos = 0
+        # Shift between filtered and source text positions
+        offset_error = 0
+        text_modified = False
+
+        for idx, entity in enumerate(entities):
+            drop_entity = False
+            # Exact type checks, TL entity types are not subclassed
+            entity_type = type(entity)
+
+            # Entities offsets are updated in-place to filtered text positions
+            source_start = entity.offset - offset_error
+            source_end = source_start + entity.length
+            entity_text = source_text[source_start:source_end]
+
+            if source_start >= source_pos and (
+                (
+                    entity_type is types.MessageEntityUrl
+                    and self._url_matcher.match(entity_text)
                 )
-                and self._match_mention(
-                    filtered_text[entity.offset : entity.offset + entity.length]
+                or (
+                    entity_type in self.MENTION_CHECKED_ENTITIES
+                    and self._match_mention(entity_text)
                 )
             ):
-                filtered_text = (
-                    filtered_text[: entity.offset]
-                    + self._placeholder
-                    + filtered_text[entity.offset + entity.length :]
-                )
+                filtered_parts.append(source_text[source_pos:source_start])
+                filtered_parts.append(self._placeholder)
+                source_pos = source_end
+
                 entity_len_diff = self._placeholder_len - entity.length
-                update_pos = True
+                self.update_entities_params(
+                    entities,
+                    entity.offset,
+                    entity.offset + entity.length,
+                    entity_len_diff,
+                )
+                offset_error += entity_len_diff
+                text_modified = True
                 drop_entity = True
             elif (
                 self._filter_by_id_mention
-                and isinstance(entity, types.MessageEntityMentionName)
+                and entity_type is types.MessageEntityMentionName
             ) or (
-                isinstance(entity, types.MessageEntityTextUrl)
+                entity_type is types.MessageEntityTextUrl
                 and self._url_matcher.match(entity.url)
             ):
                 drop_entity = True
 
-            if update_pos is True:
-                self.update_entities_params(
-                    message.entities,
-                    entity.offset,
-                    entity.offset + entity.length,
-                    entity_len_diff,
-                )
-
             if drop_entity is False:
-                filtered_entities.append(entity)
+                if filtered_entities is not None:
+                    filtered_entities.append(entity)
+            elif filtered_entities is None:
+                filtered_entities = entities[:idx]
+
+        entities_dropped = filtered_entities is not None
+        if filtered_entities is None:
+            filtered_entities = entities
+
+        filtered_parts.append(source_text[source_pos:])
+        filtered_text = "".join(filtered_parts)
 
         # Double check for URLs in text
         offset_error = 0
-        for start, end in self._url_matcher.search(filtered_text):
-            actual_start = start + offset_error
-            actual_end = end + offset_error
-
-            filtered_text = (
-                filtered_text[:actual_start]
-                + self._placeholder
-                + filtered_text[actual_end:]
-            )
 
+        def repl(url: re.Match[str]) -> str:
+            nonlocal offset_error, text_modified
+            start, end = url.span()
             diff = self._placeholder_len - (end - start)
-            offset_error += diff
-
             self.update_entities_params(
-                filtered_entities, actual_start, actual_end, diff
+                filtered_entities, start + offset_error, end + offset_error, diff
             )
+            offset_error += diff
+            text_modified = True
+            return self._placeholder
+
+        filtered_text = self._url_matcher.sub(repl, filtered_text)
 
         # Filter link preview
         if (
@@ -198,8 +249,11 @@ class UrlMessageFilter(UpdateEntitiesParams, MessageFilter):
         ):
             message.media = None
 
-        message.entities = filtered_entities
-        message.message = utils.del_surrogate(filtered_text)
+        # Leave untouched messages as is
+        if text_modified or entities_dropped:
+            message.entities = filtered_entities
+        if text_modified:
+            message.message = del_surrogate(filtered_text)
 
         return True, message
 
@@ -304,7 +358,10 @@ class ForwardFormatFilter(ChannelName, MessageLink, MessageFilter):
             pre_formatted_message
         )
 
-        message_offset = pre_formatted_text.find(self.MESSAGE_PLACEHOLDER)
+        # Telegram offsets are calculated with surrogates
+        message_offset = add_surrogate(pre_formatted_text).find(
+            self.MESSAGE_PLACEHOLDER
+        )
 
         if message.entities and message_offset > 0:
             # Move message entities to start of message placeholder
@@ -313,10 +370,10 @@ class ForwardFormatFilter(ChannelName, MessageLink, MessageFilter):
 
         if pre_formatted_entities:
             # Update entities position after message placeholder
-            message_placeholder_length_diff = len(
-                # Telegram offsets are calculated with surrogates
-                utils.add_surrogate(message.message)
-            ) - len(self.MESSAGE_PLACEHOLDER)
+            # Telegram offsets are calculated with surrogates
+            message_placeholder_length_diff = surrogate_len(message.message) - len(
+                self.MESSAGE_PLACEHOLDER
+            )
 
             for entity in pre_formatted_entities:
                 if entity.offset > message_offset:
@@ -327,7 +384,10 @@ class ForwardFormatFilter(ChannelName, MessageLink, MessageFilter):
             else:
                 message.entities = pre_formatted_entities
 
-        message.message = pre_formatted_text.format(message_text=message.message)
+        # Not `str.format`, braces in header values are kept as is
+        message.message = pre_formatted_text.replace(
+            self.MESSAGE_PLACEHOLDER, message.message
+        )
 
         return True, message
 
@@ -379,6 +439,8 @@ class KeywordReplaceFilter(UpdateEntitiesParams, WordBoundaryRegex, MessageFilte
         regex (bool, optional): Treats keywords as regex. Defaults to False
     """
 
+    KEYWORD_GROUP_PREFIX = "_keyword"
+
     def __init__(
         self,
         keywords: dict[str, str],
@@ -386,21 +448,21 @@ class KeywordReplaceFilter(UpdateEntitiesParams, WordBoundaryRegex, MessageFilte
         regex: bool = False,
     ) -> None:
         word_boundary = self.BOUNDARY_REGEX if lookup_whole_word else ""
-        self._lookup_regex = (
-            re.compile(
-                "|".join(
-                    f"{word_boundary}{re.escape(k)}{word_boundary}" for k in keywords
-                ),
-                flags=re.IGNORECASE,
-            )
-            if not regex
-            else re.compile(
-                "|".join(f"{word_boundary}{k}{word_boundary}" for k in keywords),
-                flags=re.IGNORECASE,
-            )
+        # Each keyword gets own named group, so the matched keyword
+        # is resolved with `match.lastgroup` instead of the matched text
+        self._lookup_regex = re.compile(
+            "|".join(
+                f"(?P<{self.KEYWORD_GROUP_PREFIX}{i}>"
+                f"{word_boundary}{k if regex else re.escape(k)}{word_boundary})"
+                for i, k in enumerate(keywords)
+            ),
+            flags=re.IGNORECASE,
         )
-        # Lower-cased keywords mapping
-        self._keywords_mapping = {k.lower(): v for k, v in keywords.items()}
+        # Keyword group name mapping to replacement with surrogates
+        self._replacements = {
+            f"{self.KEYWORD_GROUP_PREFIX}{i}": add_surrogate(v)
+            for i, v in enumerate(keywords.values())
+        }
 
     async def _process_message(
         self, message: EventMessage, event_type: Type[EventLike]
@@ -408,13 +470,13 @@ class KeywordReplaceFilter(UpdateEntitiesParams, WordBoundaryRegex, MessageFilte
         if not message.message:
             return True, message
 
-        filtered_text = utils.add_surrogate(message.message)
+        filtered_text = add_surrogate(message.message)
         filtered_entities = message.entities or []
         entities_offset_error = 0
 
         def repl(match: re.Match[str]) -> str:
             group = match.group()
-            replacement = utils.add_surrogate(self._keywords_mapping.get(group.lower()))
+            replacement = self._replacements[match.lastgroup]
 
             nonlocal entities_offset_error
             match_start, match_end = match.span()
@@ -435,10 +497,12 @@ class KeywordReplaceFilter(UpdateEntitiesParams, WordBoundaryRegex, MessageFilte
                 return replacement.upper()
             return replacement
 
-        filtered_text = self._lookup_regex.sub(repl, filtered_text)
+        filtered_text, replaced_count = self._lookup_regex.subn(repl, filtered_text)
+        if replaced_count == 0:
+            return True, message
 
         message.entities = filtered_entities
-        message.message = utils.del_surrogate(filtered_text)
+        message.message = del_surrogate(filtered_text)
 
         return True, message
 
@@ -469,10 +533,18 @@ class SkipWithKeywordsFilter(WordBoundaryRegex, MessageFilter):
                 flags=re.IGNORECASE,
             )
         )
+        # Lookup result for messages without text (media-only, stickers, etc.)
+        self._empty_text_found = self._lookup_regex.search("") is not None
+
+    @property
+    def modifies_message(self) -> bool:
+        return False
 
     async def _process_message(
         self, message: EventMessage, event_type: Type[EventLike]
     ) -> Tuple[bool, EventMessage]:
+        if not message.message:
+            return not self._empty_text_found, message
         return self._lookup_regex.search(message.message) is None, message
 
 
@@ -488,4 +560,6 @@ class AllowWithKeywordsFilter(SkipWithKeywordsFilter):
     async def _process_message(
         self, message: EventMessage, event_type: Type[EventLike]
     ) -> Tuple[bool, EventMessage]:
+        if not message.message:
+            return self._empty_text_found, message
         return self._lookup_regex.search(message.message) is not None, message
@@ -1,6 +1,17 @@
 import asyncio
 import logging
-from typing import Dict, List, Union
+from typing import (
+    Any,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from telethon import TelegramClient, errors, events, utils
 from telethon.sessions import StringSession
@@ -15,16 +26,18 @@ from telemirror._patch import (
     set_album_event_timeout,
 )
 from telemirror.hints import EventAlbumMessage, EventLike, EventMessage
+from telemirror.misc.lrucache import LRUCache
 from telemirror.mixins import CopyEventMessage
 from telemirror.storage import Database, MirrorMessage
 
 
 class EventProcessor(CopyEventMessage):
     GENERAL_TOPIC_ID = 1
+    SNAPSHOT_CACHE_CAPACITY = 1000
 
     def __init__(
         self: "EventProcessor",
-        chat_mapping: Dict[int, Dict[int, List[DirectionConfig]]],
+        chat_mapping: Mapping[int, Mapping[int, Sequence[DirectionConfig]]],
         database: Database,
         client: TelegramClient,
         logger: logging.Logger,
@@ -32,7 +45,7 @@ class EventProcessor(CopyEventMessage):
         """Message event processor
 
         Args:
-            chat_mapping (`Dict[int, Dict[int, List[DirectionConfig]]]`): Chats mappings
+            chat_mapping (`Mapping[int, Mapping[int, Sequence[DirectionConfig]]]`): Chats mappings
             database (`Database`): Message IDs storage
             client (`TelegramClient`): Message sender client
             logger (`logging.Logger`): Logger
@@ -41,6 +54,35 @@ class EventProcessor(CopyEventMessage):
         self._database = database
         self._client = client
         self._logger = logger
+        # Last content sent to mirror messages: (mirror_channel, mirror_id) -> snapshot
+        self._snapshots = LRUCache[Tuple[int, int], Tuple[Any, ...]](
+            capacity=EventProcessor.SNAPSHOT_CACHE_CAPACITY
+        )
+
+    @staticmethod
+    def _message_snapshot(message: EventMessage) -> Tuple[Any, ...]:
+        return (message.message, tuple(message.entities or ()), message.media)
+
+    @staticmethod
+    async def _run_per_target_chat(
+        tasks: Iterable[Tuple[int, Coroutine[Any, Any, None]]]
+    ) -> None:
+        """Runs tasks for different target chats concurrently,
+        tasks for the same target chat are run sequentially in the given order
+
+        Args:
+            tasks (`Iterable[Tuple[int, Coroutine[Any, Any, None]]]`):
+                Target chat id and task pairs
+        """
+        chat_tasks: Dict[int, List[Coroutine[Any, Any, None]]] = {}
+        for chat_id, task in tasks:
+            chat_tasks.setdefault(chat_id, []).append(task)
+
+        async def run_sequentially(tasks: List[Coroutine[Any, Any, None]]) -> None:
+            for task in tasks:
+                await task
+
+        await asyncio.gather(*(run_sequentially(t) for t in chat_tasks.values()))
 
     @staticmethod
     def __handle_exceptions(fn):
@@ -64,11 +106,11 @@ class EventProcessor(CopyEventMessage):
         outgoing_chats = self._chat_mapping.get(chat_id)
         if not outgoing_chats:
             self._logger.warning(
-                f"[New message]: No target chats for message {message_link}"
+                "[New message]: No target chats for message %s", message_link
             )
             return
 
-        self._logger.info(f"[New message]: {message_link}")
+        self._logger.info("[New message]: %s", message_link)
 
         reply_to_messages: dict[int, int] = (
             {
@@ -85,98 +127,138 @@ class EventProcessor(CopyEventMessage):
         if isinstance(message.media, types.MessageMediaPoll):
             message.media.poll.quiz = None
 
-        for outgoing_chat, configs in outgoing_chats.items():
-            for config in configs:
-                if config.from_topic_id is not None:
-                    if (
-                        message.reply_to is None
-                        and config.from_topic_id != EventProcessor.GENERAL_TOPIC_ID
-                    ):
-                        continue
-
-                    # message: topic_id = message.reply_to.reply_to_msg_id
-                    # reply: topic_id = message.reply_to.reply_to_top_id
-                    # general topic: topic_id = 1
-                    incoming_topic_id = (
-                        (
-                            message.reply_to.reply_to_top_id
-                            if message.reply_to.reply_to_top_id
-                            else message.reply_to.reply_to_msg_id
-                        )
-                        if message.reply_to and message.reply_to.forum_topic
-                        else EventProcessor.GENERAL_TOPIC_ID
-                    )
-
-                    if config.from_topic_id != incoming_topic_id:
-                        continue
-
-                if restricted_saving_content and (
-                    not config.filters.restricted_content_allowed
-                    or config.mode == "forward"
-                ):
-                    self._logger.warning(
-                        f"Forwards from channel#{chat_id} "
-                        f"with `restricted saving content` "
-                        f"enabled to channel#{outgoing_chat} are not supported."
-                    )
-                    continue
+        await self._run_per_target_chat(
+            (
+                outgoing_chat,
+                self.__send_message_to(
+                    chat_id,
+                    message,
+                    message_link,
+                    outgoing_chat,
+                    config,
+                    reply_to_messages,
+                    restricted_saving_content,
+                ),
+            )
+            for outgoing_chat, configs in outgoing_chats.items()
+            for config in configs
+        )
 
-                filtered_message: EventMessage
-                proceed, filtered_message = await config.filters.process(
-                    self.copy_message(message), events.NewMessage.Event
+    @__handle_exceptions
+    async def __send_message_to(
+        self: "EventProcessor",
+        chat_id: int,
+        message: EventMessage,
+        message_link: str,
+        outgoing_chat: int,
+        config: DirectionConfig,
+        reply_to_messages: Dict[int, int],
+        restricted_saving_content: bool,
+    ) -> None:
+        if config.from_topic_id is not None:
+            if (
+                message.reply_to is None
+                and config.from_topic_id != EventProcessor.GENERAL_TOPIC_ID
+            ):
+                return
+
+            # message: topic_id = message.reply_to.reply_to_msg_id
+            # reply: topic_id = message.reply_to.reply_to_top_id
+            # general topic: topic_id = 1
+            incoming_topic_id = (
+                (
+                    message.reply_to.reply_to_top_id
+                    if message.reply_to.reply_to_top_id
+                    else message.reply_to.reply_to_msg_id
                 )
+                if message.reply_to and message.reply_to.forum_topic
+                else EventProcessor.GENERAL_TOPIC_ID
+            )
 
-                if proceed is False:
-                    self._logger.info(
-                        f"[New message]: Message {message_link} was skipped "
-                        f"by the filter for chat#{outgoing_chat}"
-                    )
-                    continue
+            if config.from_topic_id != incoming_topic_id:
+                return
 
-                outgoing_topic_reply = (
-                    reply_to_messages.get(outgoing_chat) is not None
-                    and config.to_topic_id is not None
-                )
+        if restricted_saving_content and (
+            not config.filters.restricted_content_allowed or config.mode == "forward"
+        ):
+            self._logger.warning(
+                "Forwards from channel#%s "
+                "with `restricted saving content` "
+                "enabled to channel#%s are not supported.",
+                chat_id,
+                outgoing_chat,
+            )
+            return
 
-                outgoing_message: types.Message = None
-                try:
-                    outgoing_message = (
-                        await send_message(
-                            self._client,
-                            entity=outgoing_chat,
-                            message=filtered_message,
-                            formatting_entities=filtered_message.entities,
-                            reply_to=reply_to_messages.get(outgoing_chat)
-                            if outgoing_topic_reply or config.to_topic_id is None
-                            else config.to_topic_id,
-                            reply_to_topic_id=config.to_topic_id
-                            if outgoing_topic_reply
-                            else None,
-                        )
-                        if config.mode == "copy"
-                        else await forward_messages(
-                            self._client,
-                            entity=outgoing_chat,
-                            messages=message,
-                            reply_to_topic_id=config.to_topic_id,
-                        )
-                    )
-                except Exception as e:
-                    self._logger.error(
-                        f"Error while sending message to chat#{outgoing_chat}. "
-                        f"{type(e).__name__}: {e}"
-                    )
-                    continue
+        filtered_message: EventMessage
+        proceed, filtered_message = await config.filters.process(
+            (
+                self.copy_message(message)
+                if config.filters.modifies_message
+                else message
+            ),
+            events.NewMessage.Event,
+        )
 
-                if outgoing_message:
-                    await self._database.insert(
-                        MirrorMessage(
-                            original_id=filtered_message.id,
-                            original_channel=chat_id,
-                            mirror_id=outgoing_message.id,
-                            mirror_channel=outgoing_chat,
-                        )
-                    )
+        if proceed is False:
+            self._logger.info(
+                "[New message]: Message %s was skipped "
+                "by the filter for chat#%s",
+                message_link,
+                outgoing_chat,
+            )
+            return
+
+        outgoing_topic_reply = (
+            reply_to_messages.get(outgoing_chat) is not None
+            and config.to_topic_id is not None
+        )
+
+        outgoing_message: types.Message = None
+        try:
+            outgoing_message = (
+                await send_message(
+                    self._client,
+                    entity=outgoing_chat,
+                    message=filtered_message,
+                    formatting_entities=filtered_message.entities,
+                    reply_to=reply_to_messages.get(outgoing_chat)
+                    if outgoing_topic_reply or config.to_topic_id is None
+                    else config.to_topic_id,
+                    reply_to_topic_id=config.to_topic_id
+                    if outgoing_topic_reply
+                    else None,
+                )
+                if config.mode == "copy"
+                else await forward_messages(
+                    self._client,
+                    entity=outgoing_chat,
+                    messages=message,
+                    reply_to_topic_id=config.to_topic_id,
+                )
+            )
+        except Exception as e:
+            self._logger.error(
+                "Error while sending message to chat#%s. %s: %s",
+                outgoing_chat,
+                type(e).__name__,
+                e,
+            )
+            return
+
+        if outgoing_message:
+            if config.mode == "copy":
+                self._snapshots[(outgoing_chat, outgoing_message.id)] = (
+                    self._message_snapshot(filtered_message)
+                )
+            await self._database.insert(
+                MirrorMessage(
+                    original_id=filtered_message.id,
+                    original_channel=chat_id,
+                    mirror_id=outgoing_message.id,
+                    mirror_channel=outgoing_chat,
+                )
+            )
 
     @__handle_exceptions
     async def new_album(
@@ -189,10 +271,10 @@ class EventProcessor(CopyEventMessage):
 
         outgoing_chats = self._chat_mapping.get(chat_id)
         if not outgoing_chats:
-            self._logger.warning(f"[New album]: No target chats for chat#{chat_id}")
+            self._logger.warning("[New album]: No target chats for chat#%s", chat_id)
             return
 
-        self._logger.info(f"[New album]: {album_link}")
+        self._logger.info("[New album]: %s", album_link)
 
         reply_to_messages: dict[int, int] = (
             {
@@ -205,114 +287,146 @@ class EventProcessor(CopyEventMessage):
             else {}
         )
 
-        for outgoing_chat, configs in outgoing_chats.items():
-            for config in configs:
-                if config.from_topic_id is not None:
-                    if (
-                        incoming_first_message.reply_to is None
-                        and config.from_topic_id != EventProcessor.GENERAL_TOPIC_ID
-                    ):
-                        continue
-
-                    # message: topic_id = message.reply_to.reply_to_msg_id
-                    # reply: topic_id = message.reply_to.reply_to_top_id
-                    # general topic: topic_id = 1
-                    incoming_topic_id = (
-                        (
-                            incoming_first_message.reply_to.reply_to_top_id
-                            if incoming_first_message.reply_to.reply_to_top_id
-                            else incoming_first_message.reply_to.reply_to_msg_id
-                        )
-                        if incoming_first_message.reply_to
-                        and incoming_first_message.reply_to.forum_topic
-                        else EventProcessor.GENERAL_TOPIC_ID
-                    )
+        await self._run_per_target_chat(
+            (
+                outgoing_chat,
+                self.__send_album_to(
+                    chat_id,
+                    album,
+                    album_link,
+                    outgoing_chat,
+                    config,
+                    reply_to_messages,
+                    restricted_saving_content,
+                ),
+            )
+            for outgoing_chat, configs in outgoing_chats.items()
+            for config in configs
+        )
 
-                    if config.from_topic_id != incoming_topic_id:
-                        continue
-
-                if restricted_saving_content and (
-                    not config.filters.restricted_content_allowed
-                    or config.mode == "forward"
-                ):
-                    self._logger.warning(
-                        f"Forwards from channel#{chat_id} with "
-                        f"`restricted saving content` "
-                        f"enabled to channel#{outgoing_chat} are not supported."
-                    )
-                    continue
+    @__handle_exceptions
+    async def __send_album_to(
+        self: "EventProcessor",
+        chat_id: int,
+        album: EventAlbumMessage,
+        album_link: str,
+        outgoing_chat: int,
+        config: DirectionConfig,
+        reply_to_messages: Dict[int, int],
+        restricted_saving_content: bool,
+    ) -> None:
+        incoming_first_message: EventMessage = album[0]
 
-                filtered_album: EventAlbumMessage
-                proceed, filtered_album = await config.filters.process(
-                    self.copy_album(album), events.Album.Event
+        if config.from_topic_id is not None:
+            if (
+                incoming_first_message.reply_to is None
+                and config.from_topic_id != EventProcessor.GENERAL_TOPIC_ID
+            ):
+                return
+
+            # message: topic_id = message.reply_to.reply_to_msg_id
+            # reply: topic_id = message.reply_to.reply_to_top_id
+            # general topic: topic_id = 1
+            incoming_topic_id = (
+                (
+                    incoming_first_message.reply_to.reply_to_top_id
+                    if incoming_first_message.reply_to.reply_to_top_id
+                    else incoming_first_message.reply_to.reply_to_msg_id
                 )
+                if incoming_first_message.reply_to
+                and incoming_first_message.reply_to.forum_topic
+                else EventProcessor.GENERAL_TOPIC_ID
+            )
 
-                if proceed is False:
-                    self._logger.info(
-                        f"[New album]: Message {album_link} was skipped "
-                        f"by the filter for chat#{outgoing_chat}"
-                    )
-                    continue
+            if config.from_topic_id != incoming_topic_id:
+                return
 
-                idxs: List[int] = []
-                files: List[types.TypeMessageMedia] = []
-                captions: List[str] = []
-                for incoming_message in filtered_album:
-                    idxs.append(incoming_message.id)
-                    files.append(incoming_message.media)
-                    # Pass unparsed text, since: https://github.com/LonamiWebs/Telethon/issues/3065
-                    captions.append(incoming_message.text)
-
-                outgoing_topic_reply = (
-                    reply_to_messages.get(outgoing_chat) is not None
-                    and config.to_topic_id is not None
-                )
+        if restricted_saving_content and (
+            not config.filters.restricted_content_allowed or config.mode == "forward"
+        ):
+            self._logger.warning(
+                "Forwards from channel#%s with "
+                "`restricted saving content` "
+                "enabled to channel#%s are not supported.",
+                chat_id,
+                outgoing_chat,
+            )
+            return
 
-                outgoing_messages: List[types.Message] = None
-                try:
-                    outgoing_messages = (
-                        await send_file(
-                            self._client,
-                            entity=outgoing_chat,
-                            caption=captions,
-                            file=files,
-                            reply_to=reply_to_messages.get(outgoing_chat)
-                            if outgoing_topic_reply or config.to_topic_id is None
-                            else config.to_topic_id,
-                            reply_to_topic_id=config.to_topic_id
-                            if outgoing_topic_reply
-                            else None,
-                        )
-                        if config.mode == "copy"
-                        else await forward_messages(
-                            self._client,
-                            entity=outgoing_chat,
-                            messages=album,
-                            reply_to_topic_id=config.to_topic_id,
-                        )
-                    )
-                except Exception as e:
-                    self._logger.error(
-                        f"Error while sending album to chat#{outgoing_chat}. "
-                        f"{type(e).__name__}: {e}"
-                    )
-                    continue
+        filtered_album: EventAlbumMessage
+        proceed, filtered_album = await config.filters.process(
+            self.copy_album(album) if config.filters.modifies_message else list(album),
+            events.Album.Event,
+        )
 
-                # Expect non-empty list of messages
-                if utils.is_list_like(outgoing_messages):
-                    await self._database.insert_batch(
-                        [
-                            MirrorMessage(
-                                original_id=idxs[message_index],
-                                original_channel=chat_id,
-                                mirror_id=outgoing_message.id,
-                                mirror_channel=outgoing_chat,
-                            )
-                            for message_index, outgoing_message in enumerate(
-                                outgoing_messages
-                            )
-                        ]
+        if proceed is False:
+            self._logger.info(
+                "[New album]: Message %s was skipped "
+                "by the filter for chat#%s",
+                album_link,
+                outgoing_chat,
+            )
+            return
+
+        idxs: List[int] = []
+        files: List[types.TypeMessageMedia] = []
+        captions: List[str] = []
+        for incoming_message in filtered_album:
+            idxs.append(incoming_message.id)
+            files.append(incoming_message.media)
+            # Pass unparsed text, since: https://github.com/LonamiWebs/Telethon/issues/3065
+            captions.append(incoming_message.text)
+
+        outgoing_topic_reply = (
+            reply_to_messages.get(outgoing_chat) is not None
+            and config.to_topic_id is not None
+        )
+
+        outgoing_messages: List[types.Message] = None
+        try:
+            outgoing_messages = (
+                await send_file(
+                    self._client,
+                    entity=outgoing_chat,
+                    caption=captions,
+                    file=files,
+                    reply_to=reply_to_messages.get(outgoing_chat)
+                    if outgoing_topic_reply or config.to_topic_id is None
+                    else config.to_topic_id,
+                    reply_to_topic_id=config.to_topic_id
+                    if outgoing_topic_reply
+                    else None,
+                )
+                if config.mode == "copy"
+                else await forward_messages(
+                    self._client,
+                    entity=outgoing_chat,
+                    messages=album,
+                    reply_to_topic_id=config.to_topic_id,
+                )
+            )
+        except Exception as e:
+            self._logger.error(
+                "Error while sending album to chat#%s. %s: %s",
+                outgoing_chat,
+                type(e).__name__,
+                e,
+            )
+            return
+
+        # Expect non-empty list of messages
+        if utils.is_list_like(outgoing_messages):
+            await self._database.insert_batch(
+                [
+                    MirrorMessage(
+                        original_id=idxs[message_index],
+                        original_channel=chat_id,
+                        mirror_id=outgoing_message.id,
+                        mirror_channel=outgoing_chat,
                     )
+                    for message_index, outgoing_message in enumerate(outgoing_messages)
+                ]
+            )
 
     @__handle_exceptions
     async def edit_message(
@@ -321,72 +435,116 @@ class EventProcessor(CopyEventMessage):
         outgoing_messages = await self._database.get_messages(message.id, chat_id)
         if not outgoing_messages:
             self._logger.warning(
-                f"[Edit message]: No target messages to edit for {message_link}"
+                "[Edit message]: No target messages to edit for %s", message_link
             )
             return
 
-        self._logger.info(f"[Edit message]: {message_link}")
+        self._logger.info("[Edit message]: %s", message_link)
 
-        for outgoing_message in outgoing_messages:
-            configs = self._chat_mapping.get(chat_id, {}).get(
-                outgoing_message.mirror_channel
+        await self._run_per_target_chat(
+            (
+                outgoing_message.mirror_channel,
+                self.__edit_outgoing_message(
+                    chat_id, message, message_link, outgoing_message
+                ),
             )
+            for outgoing_message in outgoing_messages
+        )
 
-            if configs is None:
-                self._logger.warning(
-                    f"[Edit message]: No direction configs for "
-                    f"{chat_id}->{outgoing_message.mirror_channel}"
-                )
+    @__handle_exceptions
+    async def __edit_outgoing_message(
+        self: "EventProcessor",
+        chat_id: int,
+        message: EventMessage,
+        message_link: str,
+        outgoing_message: MirrorMessage,
+    ) -> None:
+        configs = self._chat_mapping.get(chat_id, {}).get(
+            outgoing_message.mirror_channel
+        )
+
+        if configs is None:
+            self._logger.warning(
+                "[Edit message]: No direction configs for %s->%s",
+                chat_id,
+                outgoing_message.mirror_channel,
+            )
+            return
+
+        for config in configs:
+            if config.disable_edit is True or config.mode == "forward":
                 continue
 
-            for config in configs:
-                if config.disable_edit is True or config.mode == "forward":
-                    continue
+            proceed, filtered_message = await config.filters.process(
+                (
+                    self.copy_message(message)
+                    if config.filters.modifies_message
+                    else message
+                ),
+                events.MessageEdited.Event,
+            )
+            if proceed is False:
+                self._logger.info(
+                    "[Edit message]: Message %s was skipped "
+                    "by the filter for chat#%s",
+                    message_link,
+                    outgoing_message.mirror_channel,
+                )
+                continue
 
-                proceed, filtered_message = await config.filters.process(
-                    self.copy_message(message), events.MessageEdited.Event
+            snapshot_key = (
+                outgoing_message.mirror_channel,
+                outgoing_message.mirror_id,
+            )
+            snapshot = self._message_snapshot(filtered_message)
+            if self._snapshots.get(snapshot_key) == snapshot:
+                # Nothing visible changed (e.g. reactions, pin toggle)
+                self._logger.info(
+                    "[Edit message]: Message %s#%s is not modified, skipped",
+                    outgoing_message.mirror_channel,
+                    outgoing_message.mirror_id,
                 )
-                if proceed is False:
-                    self._logger.info(
-                        f"[Edit message]: Message {message_link} was skipped "
-                        f"by the filter for chat#{outgoing_message.mirror_channel}"
-                    )
-                    continue
+                continue
 
-                # Prevent `MediaPrevInvalidError`: The old media cannot be edited
-                # with anything else (such as stickers or voice notes).
-                edit_media_allowed = (
-                    not isinstance(filtered_message.media, types.MessageMediaDocument)
-                    or not isinstance(filtered_message.media.document, types.Document)
-                    or not any(
-                        isinstance(attr, types.DocumentAttributeAudio)
-                        and attr.voice is True
-                        for attr in filtered_message.media.document.attributes
-                    )
+            # Prevent `MediaPrevInvalidError`: The old media cannot be edited
+            # with anything else (such as stickers or voice notes).
+            edit_media_allowed = (
+                not isinstance(filtered_message.media, types.MessageMediaDocument)
+                or not isinstance(filtered_message.media.document, types.Document)
+                or not any(
+                    isinstance(attr, types.DocumentAttributeAudio)
+                    and attr.voice is True
+                    for attr in filtered_message.media.document.attributes
+                )
+            )
+            try:
+                await self._client.edit_message(
+                    entity=outgoing_message.mirror_channel,
+                    message=outgoing_message.mirror_id,
+                    text=filtered_message.message,
+                    formatting_entities=filtered_message.entities,
+                    file=filtered_message.media if edit_media_allowed else None,
+                    link_preview=isinstance(
+                        filtered_message.media, types.MessageMediaWebPage
+                    ),
+                )
+                self._snapshots[snapshot_key] = snapshot
+            except errors.MessageNotModifiedError:
+                self._snapshots[snapshot_key] = snapshot
+                self._logger.warning(
+                    "Suppressed MessageNotModifiedError for message %s#%s",
+                    outgoing_message.mirror_channel,
+                    outgoing_message.mirror_id,
                 )
-                try:
-                    await self._client.edit_message(
-                        entity=outgoing_message.mirror_channel,
-                        message=outgoing_message.mirror_id,
-                        text=filtered_message.message,
-                        formatting_entities=filtered_message.entities,
-                        file=filtered_message.media if edit_media_allowed else None,
-                        link_preview=isinstance(
-                            filtered_message.media, types.MessageMediaWebPage
-                        ),
-                    )
-                except errors.MessageNotModifiedError:
-                    self._logger.warning(
-                        f"Suppressed MessageNotModifiedError for message "
-                        f"{outgoing_message.mirror_channel}#{outgoing_message.mirror_id}"
-                    )
 
-                except Exception as e:
-                    self._logger.error(
-                        f"Error while editing message "
-                        f"{outgoing_message.mirror_channel}#{outgoing_message.mirror_id}. "
-                        f"{type(e).__name__}: {e}"
-                    )
+            except Exception as e:
+                self._logger.error(
+                    "Error while editing message %s#%s. %s: %s",
+                    outgoing_message.mirror_channel,
+                    outgoing_message.mirror_id,
+                    type(e).__name__,
+                    e,
+                )
 
     @__handle_exceptions
     async def delete_message(
@@ -397,12 +555,12 @@ class EventProcessor(CopyEventMessage):
         )
         if not deleting_messages:
             self._logger.warning(
-                f"[Delete message]: No target messages to delete for chat#{chat_id}"
+                "[Delete message]: No target messages to delete for chat#%s", chat_id
             )
             return
 
         self._logger.info(
-            f"[Delete message]: Delete {len(message_ids)} messages from {chat_id}"
+            "[Delete message]: Delete %s messages from %s", len(message_ids), chat_id
         )
 
         deleting_per_channel: Dict[int, List[int]] = {}
@@ -414,8 +572,9 @@ class EventProcessor(CopyEventMessage):
 
             if configs is None:
                 self._logger.warning(
-                    f"[Delete message]: No direction configs for "
-                    f"{chat_id}->{deleting_message.mirror_channel}"
+                    "[Delete message]: No direction configs for %s->%s",
+                    chat_id,
+                    deleting_message.mirror_channel,
                 )
                 continue
 
@@ -434,19 +593,26 @@ class EventProcessor(CopyEventMessage):
                 )
             except Exception as e:
                 self._logger.error(
-                    f"Error while deleting messages from chat#{channel_id}. "
-                    f"{type(e).__name__}: {e}"
+                    "Error while deleting messages from chat#%s. %s: %s",
+                    channel_id,
+                    type(e).__name__,
+                    e,
                 )
 
         await self._database.delete_messages_batch(message_ids, chat_id)
 
 
 class EventHandlers:
+    # Edits that follow a not yet mirrored edit of the same message
+    # are delayed, so only the latest of them is mirrored
+    EDIT_DEBOUNCE_DELAY_SEC = 0.75
+
     def __init__(
         self: "EventHandlers",
         client: TelegramClient,
         chats: List[int],
         processor: EventProcessor,
+        logger: logging.Logger,
     ) -> None:
         """Message event handler
 
@@ -454,6 +620,7 @@ class EventHandlers:
             client (`TelegramClient`): Message receiver client
             chats (`List[int]`): List of chats to be observed
             processor (`EventProcessor`): Event processor
+            logger (`logging.Logger`): Logger
         """
         client.add_event_handler(self.on_new_message, events.NewMessage(chats=chats))
         client.add_event_handler(self.on_album, events.Album(chats=chats))
@@ -464,6 +631,13 @@ class EventHandlers:
             self.on_deleted_message, events.MessageDeleted(chats=chats)
         )
         self._processor = processor
+        self._logger = logger
+        # Running edit tasks, referenced till done
+        self._edit_tasks: Set[asyncio.Task] = set()
+        # Edits waiting for debounce delay or previous edit of the same message
+        self._pending_edits: Dict[Tuple[int, int], asyncio.Task] = {}
+        # Serializes mirroring of edits of the same message
+        self._edit_locks: Dict[Tuple[int, int], asyncio.Lock] = {}
 
     def event_message_link(self: "EventHandlers", event: EventLike) -> str:
         """Get link to event message"""
@@ -524,12 +698,73 @@ class EventHandlers:
         incoming_message: EventMessage = event.message
         incoming_message_link: str = self.event_message_link(event)
 
-        await self._processor.edit_message(
-            chat_id=incoming_chat_id,
-            message=incoming_message,
-            message_link=incoming_message_link,
+        # Mirror only the latest of successive edits
+        edit_key = (incoming_chat_id, incoming_message.id)
+        pending_edit = self._pending_edits.get(edit_key)
+        if pending_edit is not None:
+            # Not started yet, superseded by this edit
+            pending_edit.cancel()
+
+        edit_lock = self._edit_locks.get(edit_key)
+        debounce = pending_edit is not None or (
+            edit_lock is not None and edit_lock.locked()
         )
 
+        edit_task = asyncio.create_task(
+            self._debounced_edit_message(
+                edit_key,
+                debounce,
+                incoming_chat_id,
+                incoming_message,
+                incoming_message_link,
+            )
+        )
+        self._pending_edits[edit_key] = edit_task
+        self._edit_tasks.add(edit_task)
+        edit_task.add_done_callback(self._edit_tasks.discard)
+        edit_task.add_done_callback(self._log_edit_task_exception)
+
+    async def _debounced_edit_message(
+        self: "EventHandlers",
+        edit_key: Tuple[int, int],
+        debounce: bool,
+        chat_id: int,
+        message: EventMessage,
+        message_link: str,
+    ) -> None:
+        """Edits message after previous edit of the same message is mirrored.
+
+        Cancelled by a newer edit until started
+        """
+
+        if debounce:
+            await asyncio.sleep(self.EDIT_DEBOUNCE_DELAY_SEC)
+
+        edit_lock = self._edit_locks.setdefault(edit_key, asyncio.Lock())
+        try:
+            async with edit_lock:
+                # Started: a newer edit waits for this one instead of cancelling it
+                if self._pending_edits.get(edit_key) is asyncio.current_task():
+                    del self._pending_edits[edit_key]
+
+                await self._processor.edit_message(
+                    chat_id=chat_id,
+                    message=message,
+                    message_link=message_link,
+                )
+        finally:
+            if (
+                edit_key not in self._pending_edits
+                and not edit_lock.locked()
+                and self._edit_locks.get(edit_key) is edit_lock
+            ):
+                del self._edit_locks[edit_key]
+
+    def _log_edit_task_exception(self: "EventHandlers", task: asyncio.Task) -> None:
+        """Logs exception of finished edit task, nothing awaits it"""
+        if not task.cancelled() and task.exception() is not None:
+            self._logger.error(task.exception(), exc_info=task.exception())
+
     async def on_deleted_message(
         self: "EventHandlers", event: events.MessageDeleted.Event
     ) -> None:
@@ -546,7 +781,7 @@ class EventHandlers:
 class Mirroring:
     def __init__(
         self: "Mirroring",
-        chat_mapping: Dict[int, Dict[int, List[DirectionConfig]]],
+        chat_mapping: Mapping[int, Mapping[int, Sequence[DirectionConfig]]],
         database: Database,
         receiver: TelegramClient,
         sender: TelegramClient,
@@ -555,7 +790,7 @@ class Mirroring:
         """Configure channels mirroring
 
         Args:
-            chat_mapping (`Dict[int, Dict[int, List[DirectionConfig]]]`): Chats mappings
+            chat_mapping (`Mapping[int, Mapping[int, Sequence[DirectionConfig]]]`): Chats mappings
             database (`Database`): Message IDs storage
             receiver (`TelegramClient`): Message receiver client
             sender (`TelegramClient`): Message sender client, can be same as `receiver`
@@ -575,12 +810,13 @@ class Mirroring:
                 client=sender,
                 logger=logger,
             ),
+            logger=logger,
         )
 
         self._logger = logger
 
     async def run(self: "Mirroring") -> None:
-        self._logger.info(f"Channels mirroring config:\n{self.stringify_config()}")
+        self._logger.info("Channels mirroring config:\n%s", self.stringify_config())
 
         if self._sender != self._receiver:
             raise RuntimeError("Different clients are not supported now")
@@ -628,7 +864,9 @@ class Mirroring:
                     "try restart or get a new session key (run login.py)"
                 )
 
-            self._logger.info(f"Logged in as {utils.get_display_name(me)} ({me.phone})")
+            self._logger.info(
+                "Logged in as %s (%s)", utils.get_display_name(me), me.phone
+            )
 
             await client.run_until_disconnected()
         except (errors.UserDeactivatedBanError, errors.UserDeactivatedError):
@@ -656,7 +894,7 @@ class Telemirror:
         api_id: str,
         api_hash: str,
         session_string: str,
-        chat_mapping: Dict[int, Dict[int, List[DirectionConfig]]],
+        chat_mapping: Mapping[int, Mapping[int, Sequence[DirectionConfig]]],
         database: Database,
         logger: Union[str, logging.Logger] = None,
     ):
@@ -666,7 +904,7 @@ class Telemirror:
             api_id (`str`): Telegram API id
             api_hash (`str`): Telegram API hash
             session_string (`str`): Telegram (telethon) session string
-            chat_mapping (`Dict[int, Dict[int, List[DirectionConfig]]]`): Chats mappings
+            chat_mapping (`Mapping[int, Mapping[int, Sequence[DirectionConfig]]]`): Chats mappings
             database (`Database`): Message IDs storage
             logger (`str` | `logging.Logger`, optional): Logger. Defaults to None.
         """
@@ -10,7 +10,7 @@ class LRUCache(collections.OrderedDict):
         assert capacity > 0
         assert free_factor > 0.1 and free_factor <= 1.0
         self.capacity = capacity
-        self.keep_last = max(1.0, capacity * (1.0 - free_factor))
+        self.keep_last = max(1, int(capacity * (1.0 - free_factor)))
 
         super().__init__(*args, **kwargs)
 
@@ -28,3 +28,9 @@ class LRUCache(collections.OrderedDict):
         super().move_to_end(key)
 
         return val
+
+    def get(self, key, default=None):
+        # `OrderedDict.get` doesn't go through `__getitem__`
+        if key in self:
+            return self[key]
+        return default
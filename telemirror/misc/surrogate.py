@@ -0,0 +1,50 @@
+from telethon import utils
+
+# First code point outside of the Basic Multilingual Plane
+_NON_BMP_START = "\U00010000"
+
+
+def add_surrogate(text: str) -> str:
+    """`telethon.utils.add_surrogate` with a fast path for BMP-only text.
+
+    Text without astral characters (e.g. emoji) has no surrogate pairs,
+    so it is returned as is, without the per-character conversion.
+
+    Args:
+        text (`str`): Source text
+
+    Returns:
+        `str`: Text with surrogate pairs
+    """
+    if text.isascii() or max(text) < _NON_BMP_START:
+        return text
+    return utils.add_surrogate(text)
+
+
+def del_surrogate(text: str) -> str:
+    """`telethon.utils.del_surrogate` with a fast path for ASCII text.
+
+    Args:
+        text (`str`): Text with surrogate pairs
+
+    Returns:
+        `str`: Source text
+    """
+    if text.isascii():
+        return text
+    return utils.del_surrogate(text)
+
+
+def surrogate_len(text: str) -> int:
+    """Length of text with surrogate pairs, e.g. `len(add_surrogate(text))`,
+    without building the converted text
+
+    Args:
+        text (`str`): Source text
+
+    Returns:
+        `int`: Text length in UTF-16 code units
+    """
+    if text.isascii() or max(text) < _NON_BMP_START:
+        return len(text)
+    return len(text.encode("utf-16-le", "surrogatepass")) // 2
@@ -1,5 +1,7 @@
 import re
-from typing import List, Optional, Set, Tuple
+from typing import Callable, List, Optional, Set, Tuple
+
+from .lrucache import LRUCache
 
 
 class UrlMatcher:
@@ -25,8 +27,10 @@ class UrlMatcher:
 
     DIGITS = "0123456789"
 
+    MATCH_CACHE_CAPACITY = 4096
+
     SEARCH_URL_RE = re.compile(
-        r"(?:https?:\/\/)?(www\.)?[-\w@:%.\+~#=]{1,256}\.[\w]{2,4}\b([-\w@:%\+.~#?&//=]*)"
+        r"(?:https?:\/\/)?(?:www\.)?[-\w@:%.\+~#=]{1,256}\.[\w]{2,4}\b(?:[-\w@:%\+.~#?&//=]*)"
     )
 
     def __init__(self, blacklist: Set[str] = set(), whitelist: Set[str] = set()):
@@ -40,8 +44,12 @@ class UrlMatcher:
                 URLs that will be NOT matched.
                 Will be applied after the `blacklist`. Defaults to set().
         """
-        self._blacklist = {v.lower() for v in blacklist}
-        self._whitelist = {v.lower() for v in whitelist}
+        self._blacklist = frozenset(v.lower() for v in blacklist)
+        self._whitelist = frozenset(v.lower() for v in whitelist)
+        # Same URLs recur across messages of a channel
+        self._match_cache = LRUCache[str, bool](
+            capacity=UrlMatcher.MATCH_CACHE_CAPACITY
+        )
 
     def search(self, text: str) -> List[Tuple[int, int]]:
         """Search for matched URLs within text
@@ -52,12 +60,35 @@ class UrlMatcher:
         Returns:
             List[Tuple[int, int]]: Matched URLs
         """
+        # Every searched URL contains a dot
+        if "." not in text:
+            return []
+
         return [
             url.span()
             for url in self.SEARCH_URL_RE.finditer(text)
             if self.match(url.group())
         ]
 
+    def sub(self, repl: Callable[[re.Match[str]], str], text: str) -> str:
+        """Replace matched URLs within text in a single pass
+
+        Args:
+            repl (Callable[[re.Match[str]], str]): Replacement for matched URL
+            text (str): Text
+
+        Returns:
+            str: Text with replaced URLs
+        """
+        # Every searched URL contains a dot
+        if "." not in text:
+            return text
+
+        def repl_matched(url: re.Match[str]) -> str:
+            return repl(url) if self.match(url.group()) else url.group()
+
+        return self.SEARCH_URL_RE.sub(repl_matched, text)
+
     def match(self, url: str) -> bool:
         """Checks if URL matched
 
@@ -70,6 +101,15 @@ class UrlMatcher:
         if url is None:
             return False
 
+        if url in self._match_cache:
+            return self._match_cache[url]
+
+        matched = self._match(url)
+        self._match_cache[url] = matched
+        return matched
+
+    def _match(self, url: str) -> bool:
+        """Checks if URL matched, without cache"""
         host, path = self._get_url_components(url)
 
         if not host:
@@ -77,24 +117,17 @@ class UrlMatcher:
 
         host = host.lower()
 
-        if not path:
-            full_url = host
-        else:
-            # ///path -> /path
-            path = f"/{path.lstrip('/').lower()}"
-            full_url = f"{host}{path}"
-
-        if (
-            self._blacklist
-            and host not in self._blacklist
-            and full_url not in self._blacklist
-        ):
-            return False
+        in_blacklist = not self._blacklist or host in self._blacklist
+        in_whitelist = host in self._whitelist
 
-        if self._whitelist and (host in self._whitelist or full_url in self._whitelist):
-            return False
+        # Full URL lookup is only needed when host lookup is inconclusive
+        if path and (not in_blacklist or (self._whitelist and not in_whitelist)):
+            # ///path -> /path
+            full_url = f"{host}/{path.lstrip('/').lower()}"
+            in_blacklist = in_blacklist or full_url in self._blacklist
+            in_whitelist = in_whitelist or full_url in self._whitelist
 
-        return True
+        return in_blacklist and not in_whitelist
 
     def _get_url_components(self, url: str) -> Tuple[Optional[str], Optional[str]]:
         """Get host and path from [url]"""
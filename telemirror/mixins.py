@@ -1,3 +1,4 @@
+from copy import copy, deepcopy
 from typing import List, Optional
 
 from telethon import types, utils
@@ -24,19 +25,19 @@ class MessageLink:
     def message_link(self, message: EventMessage) -> Optional[str]:
         """Get link to message from origin channel"""
         if not isinstance(message.peer_id, types.PeerUser):
-            if hasattr(message.chat, "username") and message.chat.username:
-                link = f"https://t.me/{message.chat.username}/{message.id}"
-            else:
-                link = f"https://t.me/c/{message.chat.id}/{message.id}"
-            return link
+            chat = message.chat
+            username = getattr(chat, "username", None)
+            if username:
+                return f"https://t.me/{username}/{message.id}"
+            return f"https://t.me/c/{chat.id}/{message.id}"
         return None
 
 
 class CopyEventMessage:
     def copy_message(self, message: EventMessage) -> EventMessage:
-        """Copy message via constructor:
-        `message`, `entities` and `media` properties
-        shouldn't be affected by changes from original message
+        """Shallow copy of message with own
+        `entities` and `media` properties:
+        they shouldn't be affected by changes from original message
 
         Args:
             message (`EventMessage`): Source message
@@ -44,43 +45,12 @@ class CopyEventMessage:
         Returns:
             `EventMessage`: Copied message
         """
-        from copy import deepcopy
-
-        cloned = EventMessage(
-            id=message.id,
-            peer_id=message.peer_id,
-            date=message.date,
-            out=message.out,
-            mentioned=message.mentioned,
-            media_unread=message.media_unread,
-            silent=message.silent,
-            post=message.post,
-            from_id=message.from_id,
-            reply_to=message.reply_to,
-            ttl_period=message.ttl_period,
-            message=message.message,
-            fwd_from=message.fwd_from,
-            via_bot_id=message.via_bot_id,
-            media=deepcopy(message.media),
-            reply_markup=message.reply_markup,
-            entities=deepcopy(message.entities),
-            views=message.views,
-            edit_date=message.edit_date,
-            post_author=message.post_author,
-            grouped_id=message.grouped_id,
-            from_scheduled=message.from_scheduled,
-            legacy=message.legacy,
-            edit_hide=message.edit_hide,
-            pinned=message.pinned,
-            noforwards=message.noforwards,
-            reactions=message.reactions,
-            restriction_reason=message.restriction_reason,
-            forwards=message.forwards,
-            replies=message.replies,
-            action=message.action,
-        )
-        cloned._chat = message._chat
-        cloned._client = message._client
+        cloned = copy(message)
+        cloned.media = deepcopy(message.media)
+        cloned.entities = deepcopy(message.entities)
+        # Drop values cached from the source `message`, `entities` and `media`
+        cloned._text = None
+        cloned._file = None
         return cloned
 
     def copy_album(self, album: EventAlbumMessage) -> EventAlbumMessage:
@@ -1,7 +1,8 @@
+import asyncio
 from abc import abstractmethod
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any, AsyncIterator, List, Protocol
+from typing import Any, AsyncIterator, Dict, List, Optional, Protocol, Tuple
 
 from psycopg import AsyncCursor, errors
 from psycopg.rows import class_row
@@ -268,22 +269,37 @@ class PostgresDatabase(Database):
         connection_string (`str`): Postgres connection URL
         min_conn (`int`, optional): Min amount of connections. Defaults to MIN_CONN (1).
         max_conn (`int`, optional): Max amount of connections. Defaults to MAX_CONN (10).
+        cache_capacity (`int`, optional): Max amount of cached message lookups.
+            Defaults to CACHE_CAPACITY (1000).
     """
 
     MIN_CONN = 1
     MAX_CONN = 10
+    CACHE_CAPACITY = 1000
 
     def __init__(
         self,
         connection_string: str,
         min_conn: int = MIN_CONN,
         max_conn: int = MAX_CONN,
+        cache_capacity: int = CACHE_CAPACITY,
         **kwargs: Any,
     ) -> "PostgresDatabase":
         self.__conn_info = connection_string
         self.__min_conn = min_conn
         self.__max_conn = max_conn
         self.__kwargs = kwargs
+        # Lookups cache: (original_id, original_channel) -> mirror messages,
+        # tuples so callers can't change cached lookups via returned lists
+        self.__cache = LRUCache[Tuple[int, int], Tuple[MirrorMessage, ...]](
+            capacity=cache_capacity
+        )
+        # Incremented on every write to skip caching lookups raced with writes
+        self.__cache_version = 0
+        # Inserts queued while another insert transaction is in flight
+        self.__pending_inserts: List[MirrorMessage] = []
+        self.__pending_inserts_done: Optional[asyncio.Future[None]] = None
+        self.__insert_lock = asyncio.Lock()
 
     async def _async__init__(self: "PostgresDatabase") -> "PostgresDatabase":
         self.connection_pool = AsyncConnectionPool(
@@ -301,19 +317,7 @@ class PostgresDatabase(Database):
         Args:
             entity (`MirrorMessage`): `MirrorMessage` object
         """
-        async with self.__pg_cursor() as cursor:
-            await cursor.execute(
-                """
-                INSERT INTO binding_id (original_id, original_channel, mirror_id, mirror_channel)
-                VALUES (%s, %s, %s, %s)
-                """,
-                (
-                    entity.original_id,
-                    entity.original_channel,
-                    entity.mirror_id,
-                    entity.mirror_channel,
-                ),
-            )
+        await self.__insert_grouped([entity])
 
     async def insert_batch(
         self: "PostgresDatabase", entity: List[MirrorMessage]
@@ -323,22 +327,7 @@ class PostgresDatabase(Database):
         Args:
             entity (`List[MirrorMessage]`): List of `MirrorMessage` objects
         """
-        async with self.__pg_cursor() as cursor:
-            await cursor.executemany(
-                """
-                INSERT INTO binding_id (original_id, original_channel, mirror_id, mirror_channel)
-                VALUES (%s, %s, %s, %s)
-                """,
-                [
-                    (
-                        e.original_id,
-                        e.original_channel,
-                        e.mirror_id,
-                        e.mirror_channel,
-                    )
-                    for e in entity
-                ],
-            )
+        await self.__insert_grouped(entity)
 
     async def get_messages(
         self: "PostgresDatabase", original_id: int, original_channel: int
@@ -353,6 +342,11 @@ class PostgresDatabase(Database):
         Returns:
             List[MirrorMessage]
         """
+        key = (original_id, original_channel)
+        if key in self.__cache:
+            return list(self.__cache[key])
+
+        cache_version = self.__cache_version
         rows: List[MirrorMessage] = []
         async with self.__pg_cursor() as cursor:
             cursor.row_factory = class_row(MirrorMessage)
@@ -369,6 +363,8 @@ class PostgresDatabase(Database):
                 ),
             )
             rows = await cursor.fetchall()
+        if cache_version == self.__cache_version:
+            self.__cache[key] = tuple(rows)
         return rows
 
     async def get_messages_batch(
@@ -385,6 +381,18 @@ class PostgresDatabase(Database):
             List[MirrorMessage]
         """
         rows: List[MirrorMessage] = []
+        missing_ids: List[int] = []
+        for original_id in original_ids:
+            key = (original_id, original_channel)
+            if key in self.__cache:
+                rows.extend(self.__cache[key])
+            else:
+                missing_ids.append(original_id)
+
+        if not missing_ids:
+            return rows
+
+        cache_version = self.__cache_version
         async with self.__pg_cursor() as cursor:
             cursor.row_factory = class_row(MirrorMessage)
             await cursor.execute(
@@ -395,11 +403,20 @@ class PostgresDatabase(Database):
                 AND original_channel = %s
                 """,
                 (
-                    original_ids,
+                    missing_ids,
                     original_channel,
                 ),
             )
-            rows = await cursor.fetchall()
+            fetched_rows: List[MirrorMessage] = await cursor.fetchall()
+
+        if cache_version == self.__cache_version:
+            fetched: Dict[int, List[MirrorMessage]] = {i: [] for i in missing_ids}
+            for row in fetched_rows:
+                fetched[row.original_id].append(row)
+            for original_id, messages in fetched.items():
+                self.__cache[(original_id, original_channel)] = tuple(messages)
+
+        rows.extend(fetched_rows)
         return rows
 
     async def delete_messages(
@@ -424,6 +441,8 @@ class PostgresDatabase(Database):
                     original_channel,
                 ),
             )
+        self.__cache_version += 1
+        self.__cache.pop((original_id, original_channel), None)
 
     async def delete_messages_batch(
         self: "PostgresDatabase", original_ids: List[int], original_channel: int
@@ -447,6 +466,71 @@ class PostgresDatabase(Database):
                     original_channel,
                 ),
             )
+        self.__cache_version += 1
+        for original_id in original_ids:
+            self.__cache.pop((original_id, original_channel), None)
+
+    def __cache_append(self: "PostgresDatabase", entity: List[MirrorMessage]) -> None:
+        """Appends inserted `MirrorMessage` objects to already cached lookups"""
+        self.__cache_version += 1
+        for e in entity:
+            key = (e.original_id, e.original_channel)
+            if key in self.__cache:
+                self.__cache[key] = (*self.__cache[key], e)
+
+    async def __insert_grouped(
+        self: "PostgresDatabase", entity: List[MirrorMessage]
+    ) -> None:
+        """Group commit: inserts queued while a previous insert transaction
+        is in flight are written together within the next one.
+
+        The group is written all-or-nothing: a failed write, e.g. by one bad
+        row or cancelled writer, fails every caller whose rows were in the group
+
+        Args:
+            entity (`List[MirrorMessage]`): List of `MirrorMessage` objects
+        """
+        if self.__pending_inserts_done is None:
+            self.__pending_inserts_done = asyncio.get_running_loop().create_future()
+        self.__pending_inserts.extend(entity)
+        done = self.__pending_inserts_done
+
+        async with self.__insert_lock:
+            # Already written by another caller from the same group
+            if not done.done():
+                pending = self.__pending_inserts
+                self.__pending_inserts = []
+                self.__pending_inserts_done = None
+                try:
+                    async with self.__pg_cursor() as cursor:
+                        await cursor.executemany(
+                            """
+                            INSERT INTO binding_id (original_id, original_channel, mirror_id, mirror_channel)
+                            VALUES (%s, %s, %s, %s)
+                            """,
+                            [
+                                (
+                                    e.original_id,
+                                    e.original_channel,
+                                    e.mirror_id,
+                                    e.mirror_channel,
+                                )
+                                for e in pending
+                            ],
+                        )
+                except Exception as e:
+                    done.set_exception(e)
+                except BaseException:
+                    # Don't leave other callers of the group waiting forever
+                    done.set_exception(RuntimeError("Grouped insert was interrupted"))
+                    # Mark retrieved, there may be no other callers to await it
+                    done.exception()
+                    raise
+                else:
+                    self.__cache_append(pending)
+                    done.set_result(None)
+
+        await done
 
     async def __create_tables_if_not_exists(self: "PostgresDatabase"):
         """Create tables if not exists"""
@@ -0,0 +1,147 @@
+import asyncio
+import copy
+
+import pytest
+
+pytest.importorskip("telethon")
+
+from telethon import events, types, utils  # noqa: E402
+from telethon.extensions import markdown  # noqa: E402
+
+from telemirror.messagefilters import ForwardFormatFilter  # noqa: E402
+
+PLACEHOLDER = ForwardFormatFilter.MESSAGE_PLACEHOLDER
+MESSAGE_LINK = "https://t.me/c/1/2"
+
+FORMATS = [
+    ForwardFormatFilter.DEFAULT_FORMAT,
+    "[{channel_name}]({message_link}):\n{message_text}",
+    "**{channel_name}** 📢 {message_text}\n__{channel_name}__",
+]
+
+TITLES = [
+    # Plain
+    "News",
+    # Markdown metacharacters
+    "**Bold** news",
+    "__init__",
+    "a]b(c)",
+    "`code` ~~strike~~ ||spoiler||",
+    "{braces}",
+    "",
+    # Private use area chars
+    "\ue000",
+    "News \ue001\ue003",
+    # Emoji (astral chars, two UTF-16 code units each)
+    "😀",
+    "News 😀📢 channel",
+    "😀 **bold** 😀",
+]
+
+
+class FixedHeaderForwardFormat(ForwardFormatFilter):
+    def __init__(self, format: str, channel_name: str) -> None:
+        super().__init__(format)
+        self._channel_name = channel_name
+
+    def channel_name(self, message):
+        return self._channel_name
+
+    def message_link(self, message):
+        return MESSAGE_LINK
+
+
+def entities_dump(entities):
+    return [(type(e), e.to_dict()) for e in entities or []]
+
+
+def expected_message(format: str, channel_name: str, message: types.Message):
+    """Reference result: parse the whole header per message"""
+    header, header_entities = markdown.parse(
+        format.format(
+            message_text=PLACEHOLDER,
+            channel_name=channel_name,
+            message_link=MESSAGE_LINK,
+        )
+    )
+    message_offset = len(utils.add_surrogate(header[: header.index(PLACEHOLDER)]))
+    length_diff = len(utils.add_surrogate(message.message)) - len(PLACEHOLDER)
+
+    entities = []
+    for entity in message.entities or []:
+        entity = copy.copy(entity)
+        entity.offset += message_offset
+        entities.append(entity)
+    for entity in header_entities:
+        if entity.offset > message_offset:
+            entity.offset += length_diff
+        entities.append(entity)
+
+    return header.replace(PLACEHOLDER, message.message), entities
+
+
+def make_message() -> types.Message:
+    return types.Message(
+        id=2,
+        peer_id=types.PeerChannel(1),
+        date=None,
+        message="Hi 😀 there",
+        entities=[
+            types.MessageEntityBold(offset=0, length=2),
+            types.MessageEntityItalic(offset=3, length=2),
+        ],
+    )
+
+
+def process(message_filter: ForwardFormatFilter, message: types.Message):
+    return asyncio.run(
+        message_filter._process_message(message, events.NewMessage.Event)
+    )
+
+
+@pytest.mark.parametrize("format", FORMATS)
+@pytest.mark.parametrize("channel_name", TITLES)
+def test_header_matches_per_message_parsing(format, channel_name):
+    message_filter = FixedHeaderForwardFormat(format, channel_name)
+
+    proceed, message = process(message_filter, make_message())
+
+    expected_text, expected_entities = expected_message(
+        format, channel_name, make_message()
+    )
+    assert proceed is True
+    assert message.message == expected_text
+    assert entities_dump(message.entities) == entities_dump(expected_entities)
+
+
+def test_emoji_title_offsets_in_utf16_units():
+    message_filter = FixedHeaderForwardFormat(
+        "[{channel_name}]({message_link}): {message_text}", "😀 News"
+    )
+
+    _, message = process(message_filter, make_message())
+
+    assert message.message == "😀 News: Hi 😀 there"
+    link, bold, italic = sorted(message.entities, key=lambda e: e.offset)
+    assert (link.offset, link.length) == (0, 7)
+    # "😀 News: " is 9 UTF-16 code units
+    assert (bold.offset, bold.length) == (9, 2)
+    assert (italic.offset, italic.length) == (12, 2)
+
+
+@pytest.mark.parametrize("channel_name", ["😀 **bold**", "😀 {braces}"])
+def test_emoji_title_offsets_with_markdown(channel_name):
+    message_filter = FixedHeaderForwardFormat(
+        "{channel_name}\n{message_text}", channel_name
+    )
+
+    _, message = process(message_filter, make_message())
+
+    header = markdown.parse(channel_name)[0] + "\n"
+    assert message.message == header + "Hi 😀 there"
+    bold = next(
+        e
+        for e in message.entities
+        if isinstance(e, types.MessageEntityBold) and e.length == 2
+    )
+    assert bold.offset == len(utils.add_surrogate(header))
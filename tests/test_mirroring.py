@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import os
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("telethon")
+pytest.importorskip("decouple")
+
+# Minimal settings for `config`, imported by `telemirror.mirroring`
+for key, value in {
+    "API_ID": "1",
+    "API_HASH": "hash",
+    "SESSION_STRING": "session",
+    "USE_MEMORY_DB": "true",
+    "CHAT_MAPPING": "[-1001:-1002]",
+}.items():
+    os.environ.setdefault(key, value)
+
+from telemirror.mirroring import EventHandlers  # noqa: E402
+
+
+class Client:
+    def add_event_handler(self, callback, event):
+        pass
+
+
+class EditProcessor:
+    """Processor that mirrors edits once released, failing on `fail` text"""
+
+    def __init__(self) -> None:
+        self.edited = []
+        self.running = 0
+        self.max_running = 0
+        self.release = asyncio.Event()
+
+    async def edit_message(self, chat_id, message, message_link):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await self.release.wait()
+            if message.text == "fail":
+                raise RuntimeError("Edit failed")
+            self.edited.append(message.text)
+        finally:
+            self.running -= 1
+
+
+class FastEventHandlers(EventHandlers):
+    EDIT_DEBOUNCE_DELAY_SEC = 0.01
+
+    def event_message_link(self, event):
+        return "https://t.me/c/1001/2"
+
+
+def make_handlers(processor: EditProcessor) -> FastEventHandlers:
+    return FastEventHandlers(
+        client=Client(),
+        chats=[-1001],
+        processor=processor,
+        logger=logging.getLogger(__name__),
+    )
+
+
+def edit_event(text: str):
+    return SimpleNamespace(
+        chat_id=-1001, message=SimpleNamespace(id=2, text=text, edit_hide=False)
+    )
+
+
+async def wait_edits(handlers: EventHandlers) -> None:
+    while handlers._edit_tasks:
+        await asyncio.wait(set(handlers._edit_tasks))
+
+
+def test_edits_are_serialized_and_superseded():
+    processor = EditProcessor()
+
+    async def run() -> FastEventHandlers:
+        handlers = make_handlers(processor)
+
+        await handlers.on_edit_message(edit_event("a"))
+        await asyncio.sleep(0)
+        # The first edit is mirrored without delay
+        assert processor.running == 1
+
+        # Both wait for the first edit, the last one supersedes the other
+        await handlers.on_edit_message(edit_event("b"))
+        await handlers.on_edit_message(edit_event("c"))
+
+        processor.release.set()
+        await wait_edits(handlers)
+        return handlers
+
+    handlers = asyncio.run(run())
+
+    assert processor.edited == ["a", "c"]
+    assert processor.max_running == 1
+    assert handlers._pending_edits == {}
+    assert handlers._edit_locks == {}
+
+
+def test_edit_errors_are_logged(caplog):
+    processor = EditProcessor()
+    processor.release.set()
+
+    async def run() -> FastEventHandlers:
+        handlers = make_handlers(processor)
+        await handlers.on_edit_message(edit_event("fail"))
+        await wait_edits(handlers)
+        return handlers
+
+    with caplog.at_level(logging.ERROR):
+        handlers = asyncio.run(run())
+
+    assert "Edit failed" in caplog.text
+    assert handlers._edit_tasks == set()
@@ -0,0 +1,124 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("telethon")
+
+from telethon import types  # noqa: E402
+
+from telemirror._patch.sending import _send_album, send_message  # noqa: E402
+
+SELF_ID = 777
+
+
+class ShortSentClient:
+    """Client that answers every request with `UpdateShortSentMessage`"""
+
+    def __init__(self) -> None:
+        self.resolved_peers = []
+
+    async def __call__(self, request):
+        return types.UpdateShortSentMessage(
+            id=1, pts=1, pts_count=1, date=datetime.now(timezone.utc), out=True
+        )
+
+    async def _get_peer(self, peer):
+        self.resolved_peers.append(peer)
+        return types.PeerUser(SELF_ID)
+
+
+@pytest.fixture(autouse=True)
+def skip_finish_init(monkeypatch):
+    monkeypatch.setattr(types.Message, "_finish_init", lambda self, *args: None)
+
+
+def test_short_sent_message_to_self():
+    client = ShortSentClient()
+
+    message = asyncio.run(
+        send_message(client, types.InputPeerSelf(), "Hi", formatting_entities=[])
+    )
+
+    assert message.peer_id == types.PeerUser(SELF_ID)
+    assert len(client.resolved_peers) == 1
+
+
+def test_short_sent_message_to_channel():
+    client = ShortSentClient()
+
+    message = asyncio.run(
+        send_message(
+            client,
+            types.InputPeerChannel(channel_id=42, access_hash=1),
+            "Hi",
+            formatting_entities=[],
+        )
+    )
+
+    assert message.peer_id == types.PeerChannel(42)
+    assert client.resolved_peers == []
+
+
+class AlbumClient:
+    """Client that uploads album files in steps, failing on `bad` files"""
+
+    UPLOAD_STEPS = 4
+
+    def __init__(self) -> None:
+        self.cancelled_files = []
+
+    async def __call__(self, request):
+        return request
+
+    async def _parse_message_text(self, message, parse_mode):
+        return message, None
+
+    async def _file_to_media(self, file, progress_callback=None, **kwargs):
+        try:
+            for step in range(1, self.UPLOAD_STEPS + 1):
+                await asyncio.sleep(0)
+                if file == "bad":
+                    raise ValueError(file)
+                if progress_callback:
+                    progress_callback(step, self.UPLOAD_STEPS)
+        except asyncio.CancelledError:
+            self.cancelled_files.append(file)
+            raise
+        return None, types.InputMediaPhoto(types.InputPhoto(1, 1, b"")), None
+
+    def _get_response_message(self, random_ids, result, entity):
+        return random_ids
+
+
+def send_album(client, files, **kwargs):
+    return asyncio.run(
+        _send_album(
+            client,
+            types.InputPeerChannel(channel_id=42, access_hash=1),
+            files,
+            **kwargs,
+        )
+    )
+
+
+def test_album_upload_error_cancels_other_uploads():
+    client = AlbumClient()
+
+    with pytest.raises(ValueError):
+        send_album(client, ["a", "bad", "c"])
+
+    assert sorted(client.cancelled_files) == ["a", "c"]
+
+
+def test_album_upload_progress_never_goes_back():
+    client = AlbumClient()
+    progress = []
+
+    sent = send_album(
+        client, ["a", "b", "c"], progress_callback=lambda s, t: progress.append(s)
+    )
+
+    assert len(sent) == 3
+    assert progress == sorted(progress)
+    assert progress[-1] == 3
@@ -0,0 +1,88 @@
+import asyncio
+import gc
+from contextlib import asynccontextmanager
+
+import pytest
+
+pytest.importorskip("psycopg")
+pytest.importorskip("psycopg_pool")
+
+from telemirror.storage import MirrorMessage, PostgresDatabase  # noqa: E402
+
+
+class ConnectionPool:
+    """Pool that writes rows once released, failing on negative mirror IDs"""
+
+    def __init__(self) -> None:
+        self.written = []
+        self.release = asyncio.Event()
+
+    @asynccontextmanager
+    async def connection(self):
+        yield self
+
+    @asynccontextmanager
+    async def cursor(self):
+        yield self
+
+    async def executemany(self, query, rows):
+        await self.release.wait()
+        if any(mirror_id < 0 for _, _, mirror_id, _ in rows):
+            raise ValueError("Bad row")
+        self.written.extend(rows)
+
+
+def make_database() -> PostgresDatabase:
+    database = PostgresDatabase("postgresql://localhost/test")
+    database.connection_pool = ConnectionPool()
+    return database
+
+
+def mirror_message(mirror_id: int) -> MirrorMessage:
+    return MirrorMessage(
+        original_id=1, original_channel=-1001, mirror_id=mirror_id, mirror_channel=-1002
+    )
+
+
+def test_failed_group_fails_only_its_callers():
+    async def run():
+        database = make_database()
+
+        first = asyncio.create_task(database.insert(mirror_message(1)))
+        await asyncio.sleep(0)
+        # Queued while the first insert is in flight, written as one group
+        good = asyncio.create_task(database.insert(mirror_message(2)))
+        bad = asyncio.create_task(database.insert_batch([mirror_message(-3)]))
+        await asyncio.sleep(0)
+
+        database.connection_pool.release.set()
+        results = await asyncio.gather(first, good, bad, return_exceptions=True)
+        return database.connection_pool.written, results
+
+    written, (first, good, bad) = asyncio.run(run())
+
+    assert first is None
+    assert isinstance(good, ValueError)
+    assert isinstance(bad, ValueError)
+    assert written == [(1, -1001, 1, -1002)]
+
+
+def test_cancelled_writer_leaves_no_unretrieved_error():
+    async def run():
+        unhandled = []
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: unhandled.append(context)
+        )
+
+        database = make_database()
+        writer = asyncio.create_task(database.insert(mirror_message(1)))
+        await asyncio.sleep(0)
+        writer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await writer
+
+        del writer
+        gc.collect()
+        return unhandled
+
+    assert asyncio.run(run()) == []
@@ -0,0 +1,25 @@
+import pytest
+
+pytest.importorskip("telethon")
+
+from telethon import utils  # noqa: E402
+
+from telemirror.misc.surrogate import surrogate_len  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "abc",
+        "привет",
+        "😀",
+        "Hi 😀 there 📢",
+        # Lone surrogates, alone and mixed with astral chars
+        "\ud83d",
+        "\ud800😀",
+        "a\udc00b😀😀",
+    ],
+)
+def test_surrogate_len_matches_add_surrogate(text):
+    assert surrogate_len(text) == len(utils.add_surrogate(text))
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("telethon")
+
+from telethon import events, types  # noqa: E402
+
+from telemirror.messagefilters import (  # noqa: E402
+    ForwardFormatFilter,
+    UrlMessageFilter,
+)
+
+
+class HeaderFirstForwardFormat(ForwardFormatFilter):
+    def __init__(self) -> None:
+        super().__init__("[{channel_name}]({message_link})\n{message_text}")
+
+    def channel_name(self, message):
+        return "Channel"
+
+    def message_link(self, message):
+        return "https://t.me/c/1/2"
+
+
+def make_message() -> types.Message:
+    return types.Message(
+        id=2,
+        peer_id=types.PeerChannel(1),
+        date=None,
+        message="go to example.com, now",
+        entities=[
+            types.MessageEntityUrl(offset=6, length=11),
+            types.MessageEntityBold(offset=19, length=3),
+        ],
+    )
+
+
+def process(message_filter, message):
+    return asyncio.run(message_filter.process(message, events.NewMessage.Event))
+
+
+def test_unsorted_entities_after_forward_format():
+    _, message = process(HeaderFirstForwardFormat(), make_message())
+    # Header entity is appended after the message entities
+    assert [type(e) for e in message.entities] == [
+        types.MessageEntityUrl,
+        types.MessageEntityBold,
+        types.MessageEntityTextUrl,
+    ]
+
+    _, message = process(
+        UrlMessageFilter(blacklist={"example.com"}, filter_mention=True), message
+    )
+
+    assert message.message == "***\ngo to ***, now"
+    assert [(type(e), e.offset, e.length) for e in message.entities] == [
+        (types.MessageEntityBold, 15, 3)
+    ]